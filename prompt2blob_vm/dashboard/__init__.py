@@ -1,9 +1,25 @@
 """Dashboard module for Prompt2Blob Version Manager."""
 
-from prompt2blob_vm.dashboard.app import PromptDashboard
-from prompt2blob_vm.dashboard.app import main as runner
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from prompt2blob_vm.dashboard.app import PromptDashboard
+    from prompt2blob_vm.dashboard.app import main as runner
 
 __all__ = [
     "PromptDashboard",
     "runner",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Streamlit app on first use, so importing the package stays cheap."""
+    if name == "PromptDashboard":
+        from prompt2blob_vm.dashboard.app import PromptDashboard
+
+        return PromptDashboard
+    if name == "runner":
+        from prompt2blob_vm.dashboard.app import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,9 @@
 """Streamlit dashboard for prompt management with comprehensive features."""
 
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import streamlit as st
 import yaml
@@ -12,7 +13,308 @@ from prompt2blob_vm.dashboard.file_explorer import (
     GCSFileExplorer,
     LocalFileExplorer,
 )
-from prompt2blob_vm.version_manager import VersionManager
+from prompt2blob_vm.version_manager import YAML_LOADER, VersionManager
+
+# Upper bounds on the number of files rendered per rerun, since every option or
+# button is a widget that Streamlit has to serialize and reconcile
+MAX_SHOWN_FILES = 200
+MAX_SHOWN_ENTRIES_PER_DIR = 50
+
+
+@st.cache_data(ttl=30)
+def _list_local_yaml(local_dir: str, dir_mtime: float) -> Tuple[Tuple[str, str], ...]:
+    """List the local YAML files, cached across Streamlit reruns.
+
+    Args:
+        local_dir: Local prompts directory to scan
+        dir_mtime: Modification time of local_dir, only used as part of the cache key
+            so that adding or removing top-level entries invalidates the cache
+
+    Returns:
+        Sorted tuple of tuples (display_name, full_path)
+    """
+    local_path = Path(local_dir)
+    files = []
+    for file_path in local_path.rglob("*.yaml"):
+        relative_path = file_path.relative_to(local_path)
+        files.append((str(relative_path), str(file_path)))
+    return tuple(sorted(files))
+
+
+@st.cache_data(ttl=30)
+def _cached_list_local_dir_shallow(
+    local_dir: str, relative_dir: str, dir_mtime: float
+) -> Dict[str, List]:
+    """List the immediate entries of a local directory, cached across reruns.
+
+    Args:
+        local_dir: Local prompts directory
+        relative_dir: Directory path relative to local_dir ("" for the root)
+        dir_mtime: Modification time of the directory, only used as part of the
+            cache key so that adding or removing entries invalidates the cache
+
+    Returns:
+        Dictionary with the relative paths of the subdirectories, and tuples
+        (display_name, full_path) of the YAML files
+    """
+    return LocalFileExplorer(local_dir).list_dir_shallow(relative_dir)
+
+
+@st.cache_data(ttl=60)
+def _cached_list_gcs_dir_shallow(
+    _gcs_explorer: GCSFileExplorer,
+    gcs_bucket_name: Optional[str],
+    gcs_dir_path: Optional[str],
+    version: str,
+    relative_dir: str,
+) -> Dict[str, List]:
+    """List the immediate entries of a directory in a GCS version, cached across reruns.
+
+    Args:
+        _gcs_explorer: GCSFileExplorer used to query GCS (excluded from the cache key)
+        gcs_bucket_name: GCS bucket name, used as part of the cache key
+        gcs_dir_path: Path within the GCS bucket, used as part of the cache key
+        version: Version string (e.g., "1.0.0")
+        relative_dir: Directory path relative to the version root ("" for the root)
+
+    Returns:
+        Dictionary with the relative paths of the subdirectories, and tuples
+        (display_name, full_path) of the files
+    """
+    return _gcs_explorer.list_dir_shallow(version, relative_dir)
+
+
+@st.cache_data(ttl=15)
+def _cached_file_stats(local_dir: str, dir_mtime: float) -> Dict:
+    """Collect the local file statistics, cached across Streamlit reruns.
+
+    Args:
+        local_dir: Local prompts directory to scan
+        dir_mtime: Modification time of local_dir, only used as part of the cache key
+            so that adding or removing top-level entries invalidates the cache
+
+    Returns:
+        Dictionary containing file statistics
+    """
+    return LocalFileExplorer(local_dir).get_file_stats()
+
+
+@st.cache_data(ttl=60)
+def _cached_list_versions(
+    _version_manager: VersionManager,
+    gcs_bucket_name: Optional[str],
+    gcs_dir_path: Optional[str],
+) -> List[str]:
+    """List the GCS versions, cached across Streamlit reruns.
+
+    Args:
+        _version_manager: VersionManager used to query GCS (excluded from the cache key)
+        gcs_bucket_name: GCS bucket name, used as part of the cache key
+        gcs_dir_path: Path within the GCS bucket, used as part of the cache key
+
+    Returns:
+        List of version numbers sorted in descending order (most recent first)
+    """
+    return _version_manager.list_versions()
+
+
+@st.cache_data(ttl=60)
+def _cached_list_files_in_version(
+    _gcs_explorer: GCSFileExplorer,
+    gcs_bucket_name: Optional[str],
+    gcs_dir_path: Optional[str],
+    version: str,
+) -> List[Dict[str, str]]:
+    """List the files in a GCS version, cached across Streamlit reruns.
+
+    Args:
+        _gcs_explorer: GCSFileExplorer used to query GCS (excluded from the cache key)
+        gcs_bucket_name: GCS bucket name, used as part of the cache key
+        gcs_dir_path: Path within the GCS bucket, used as part of the cache key
+        version: Version string (e.g., "1.0.0")
+
+    Returns:
+        List of dictionaries containing file information
+    """
+    return _gcs_explorer.list_files_in_version(version)
+
+
+@st.cache_data(ttl=30)
+def _cached_local_search_index(
+    local_dir: str, dir_mtime: float
+) -> Tuple[Tuple[str, str, str], ...]:
+    """Pair the local YAML files with their lowercased names for searching.
+
+    Args:
+        local_dir: Local prompts directory to scan
+        dir_mtime: Modification time of local_dir, only used as part of the cache key
+
+    Returns:
+        Sorted tuple of tuples (lowercased display_name, display_name, full_path)
+    """
+    return tuple(
+        (display_name.lower(), display_name, full_path)
+        for display_name, full_path in _list_local_yaml(local_dir, dir_mtime)
+    )
+
+
+@st.cache_data(ttl=60)
+def _cached_gcs_search_index(
+    _gcs_explorer: GCSFileExplorer,
+    gcs_bucket_name: Optional[str],
+    gcs_dir_path: Optional[str],
+    version: str,
+) -> Tuple[Tuple[str, str, str], ...]:
+    """Pair the files in a GCS version with their lowercased names for searching.
+
+    Args:
+        _gcs_explorer: GCSFileExplorer used to query GCS (excluded from the cache key)
+        gcs_bucket_name: GCS bucket name, used as part of the cache key
+        gcs_dir_path: Path within the GCS bucket, used as part of the cache key
+        version: Version string (e.g., "1.0.0")
+
+    Returns:
+        Sorted tuple of tuples (lowercased name, name, name)
+    """
+    files = _cached_list_files_in_version(
+        _gcs_explorer, gcs_bucket_name, gcs_dir_path, version
+    )
+    return tuple((f["name"].lower(), f["name"], f["name"]) for f in files)
+
+
+@st.cache_data(ttl=300, max_entries=256)
+def _cached_load_local_file(file_path: str, mtime_ns: int) -> str:
+    """Read a local file, cached across Streamlit reruns.
+
+    Args:
+        file_path: Path to the local file
+        mtime_ns: Modification time of the file, only used as part of the cache key
+            so that saving the file invalidates the cache
+
+    Returns:
+        File content as string
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@st.cache_data(ttl=300, max_entries=256)
+def _cached_load_gcs_file(
+    _gcs_explorer: GCSFileExplorer,
+    gcs_bucket_name: Optional[str],
+    gcs_dir_path: Optional[str],
+    version: str,
+    file_path: str,
+    etag: Optional[str],
+) -> Optional[str]:
+    """Download a file from a GCS version, cached across Streamlit reruns.
+
+    Args:
+        _gcs_explorer: GCSFileExplorer used to query GCS (excluded from the cache key)
+        gcs_bucket_name: GCS bucket name, used as part of the cache key
+        gcs_dir_path: Path within the GCS bucket, used as part of the cache key
+        version: Version string (e.g., "1.0.0")
+        file_path: Relative file path within the version
+        etag: ETag of the blob from the version listing, used as part of the cache key
+
+    Returns:
+        File content as string or None if not found
+    """
+    return _gcs_explorer.get_file_content_from_gcs(version, file_path)
+
+
+@st.cache_data(ttl=3600)
+def _cached_version_metadata(
+    _gcs_explorer: GCSFileExplorer,
+    gcs_bucket_name: Optional[str],
+    gcs_dir_path: Optional[str],
+    version: str,
+) -> Dict[str, Any]:
+    """Get the metadata of a GCS version, cached across Streamlit reruns.
+
+    Snapshotted versions are immutable, so the metadata can be cached for long.
+
+    Args:
+        _gcs_explorer: GCSFileExplorer used to query GCS (excluded from the cache key)
+        gcs_bucket_name: GCS bucket name, used as part of the cache key
+        gcs_dir_path: Path within the GCS bucket, used as part of the cache key
+        version: Version string (e.g., "1.0.0")
+
+    Returns:
+        Dictionary containing version metadata
+    """
+    return _gcs_explorer.get_version_metadata(version)
+
+
+@st.cache_data(ttl=300, max_entries=64)
+def _cached_compare_versions(
+    _gcs_explorer: GCSFileExplorer,
+    gcs_bucket_name: Optional[str],
+    gcs_dir_path: Optional[str],
+    version1: str,
+    version2: str,
+) -> Dict[str, List[str]]:
+    """Compare the files between two GCS versions, cached across Streamlit reruns.
+
+    Snapshotted versions are immutable, so the comparison result only depends on
+    the location and the two version strings.
+
+    Args:
+        _gcs_explorer: GCSFileExplorer used to query GCS (excluded from the cache key)
+        gcs_bucket_name: GCS bucket name, used as part of the cache key
+        gcs_dir_path: Path within the GCS bucket, used as part of the cache key
+        version1: First version to compare
+        version2: Second version to compare
+
+    Returns:
+        Dictionary with added, removed, and modified files
+    """
+    return _gcs_explorer.compare_versions(version1, version2)
+
+
+@st.cache_data(max_entries=64)
+def _parse_yaml(content: str) -> Any:
+    """Parse YAML content, cached across Streamlit reruns.
+
+    Args:
+        content: YAML content to parse
+
+    Returns:
+        Parsed YAML data
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    return yaml.load(content, Loader=YAML_LOADER)
+
+
+@st.cache_data(max_entries=32)
+def _build_file_tree(files: Tuple[Tuple[str, str], ...]) -> Dict:
+    """Group files by directory into a nested dictionary, cached across reruns.
+
+    Args:
+        files: Tuples (display_name, full_path) of the files to group
+
+    Returns:
+        Nested dictionary mapping directory names to subtrees and file names to
+        full paths
+    """
+    file_tree = {}
+    for display_name, full_path in files:
+        parts = Path(display_name).parts
+        current = file_tree
+
+        # Build nested structure
+        for part in parts[:-1]:
+            if part not in current:
+                current[part] = {}
+            current = current[part]
+
+        # Add file
+        filename = parts[-1]
+        current[filename] = full_path
+
+    return file_tree
 
 
 class PromptDashboard:
@@ -25,7 +327,10 @@ class PromptDashboard:
             version_manager: An instance of VersionManager or its subclasses
         """
         self.version_manager = version_manager
-        self._init_session_state()
+        self._config_error: Optional[str] = None
+        # Listings memoized for the duration of a single run(), kept per thread
+        # since the dashboard instance is shared between sessions
+        self._run_memo = threading.local()
         self._init_file_explorers()
 
     def _init_session_state(self) -> None:
@@ -36,6 +341,7 @@ class PromptDashboard:
             "file_content": "",
             "gcs_configured": False,
             "show_file_tree": False,
+            "expanded_dirs": set(),
             "search_query": "",
             "comparison_mode": False,
             "compare_version1": "local",
@@ -46,6 +352,8 @@ class PromptDashboard:
             if key not in st.session_state:
                 st.session_state[key] = value
 
+        st.session_state.gcs_configured = self.gcs_explorer is not None
+
     def _init_file_explorers(self) -> None:
         """Initialize the file explorers based on the prompt manager configuration."""
         try:
@@ -56,10 +364,8 @@ class PromptDashboard:
                 and hasattr(self.version_manager, "gcs_dir_path")
                 and self.version_manager.gcs_dir_path
             ):
-                st.session_state.gcs_configured = True
                 self.gcs_explorer = GCSFileExplorer(self.version_manager)
             else:
-                st.session_state.gcs_configured = False
                 self.gcs_explorer = None
 
             # Initialize local explorer with the prompt manager's local directory
@@ -67,10 +373,50 @@ class PromptDashboard:
             self.local_explorer = LocalFileExplorer(local_dir)
 
         except Exception as e:
-            st.sidebar.error(f"Configuration error: {e}")
+            # Rendered in run() rather than here, since the dashboard instance may
+            # outlive the rerun that constructed it
+            self._config_error = f"Configuration error: {e}"
             self.gcs_explorer = None
             self.local_explorer = None
 
+    def _reset_run_memo(self) -> None:
+        """Forget the listings memoized during the previous run."""
+        self._run_memo.versions = None
+        self._run_memo.files_by_version = {}
+
+    def _list_versions(self) -> List[str]:
+        """List the GCS versions through the Streamlit cache, once per run."""
+        versions = getattr(self._run_memo, "versions", None)
+        if versions is None:
+            versions = _cached_list_versions(
+                self.version_manager,
+                self.version_manager.gcs_bucket_name,
+                self.version_manager.gcs_dir_path,
+            )
+            self._run_memo.versions = versions
+        return versions
+
+    def _list_files_in_version(self, version: str) -> List[Dict[str, str]]:
+        """List the files in a GCS version through the Streamlit cache, once per run."""
+        files_by_version = getattr(self._run_memo, "files_by_version", None)
+        if files_by_version is None:
+            files_by_version = self._run_memo.files_by_version = {}
+        if version not in files_by_version:
+            files_by_version[version] = _cached_list_files_in_version(
+                self.gcs_explorer,
+                self.version_manager.gcs_bucket_name,
+                self.version_manager.gcs_dir_path,
+                version,
+            )
+        return files_by_version[version]
+
+    def _get_gcs_file_info(self, version: str, file_path: str) -> Optional[Dict]:
+        """Look up the listing metadata of a file in a GCS version."""
+        return next(
+            (f for f in self._list_files_in_version(version) if f["name"] == file_path),
+            None,
+        )
+
     def _render_sidebar_stats(self) -> None:
         """Render statistics in the sidebar."""
         if not self.local_explorer:
@@ -90,14 +436,20 @@ class PromptDashboard:
 
             # Local file stats
             st.subheader("File Statistics")
-            local_stats = self.local_explorer.get_file_stats()
+            local_dir = self.local_explorer.local_dir
+            if local_dir.exists():
+                local_stats = _cached_file_stats(
+                    str(local_dir), local_dir.stat().st_mtime
+                )
+            else:
+                local_stats = self.local_explorer.get_file_stats()
             st.metric("Local Files", local_stats["total_files"])
             st.metric("Local Size", f"{local_stats['total_size']:,} bytes")
 
             # GCS version count
             if st.session_state.gcs_configured and self.version_manager:
                 try:
-                    versions = self.version_manager.list_versions()
+                    versions = self._list_versions()
                     st.metric("GCS Versions", len(versions))
                 except Exception:
                     st.metric("GCS Versions", "Error")
@@ -107,12 +459,16 @@ class PromptDashboard:
         col1, col2, col3 = st.columns([2, 1, 1])
 
         with col1:
-            search_query = st.text_input(
-                "🔍 Search Files",
-                value=st.session_state.search_query,
-                placeholder="Enter filename or path...",
-            )
-            st.session_state.search_query = search_query
+            # Only apply the query on submit, so the file list is not re-filtered
+            # every time the input loses focus while the user is still typing
+            with st.form("search_form"):
+                search_query = st.text_input(
+                    "🔍 Search Files",
+                    value=st.session_state.search_query,
+                    placeholder="Enter filename or path...",
+                )
+                if st.form_submit_button("Search"):
+                    st.session_state.search_query = search_query
 
         with col2:
             st.session_state.show_file_tree = st.checkbox(
@@ -130,42 +486,128 @@ class PromptDashboard:
             st.info("No files found.")
             return None
 
-        # Group files by directory
-        file_tree = {}
-        for display_name, full_path in files:
-            parts = Path(display_name).parts
-            current = file_tree
-
-            # Build nested structure
-            for part in parts[:-1]:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-
-            # Add file
-            filename = parts[-1]
-            current[filename] = full_path
-
-        # Render tree
-        def render_tree_level(tree_dict: Dict, level: int = 0) -> Optional[str]:
-            selected_file = None
-            indent = "  " * level
+        file_tree = _build_file_tree(tuple(files))
 
-            for name, value in sorted(tree_dict.items()):
+        # Render the whole tree as a single markdown block, and collect the files
+        # into a flat list so that selection is a single widget rather than one
+        # button per file
+        lines = []
+        leaves = []
+
+        def render_tree_level(tree_dict: Dict, parts: Tuple[str, ...] = ()) -> None:
+            indent = "&nbsp;" * 4 * len(parts)
+
+            entries = sorted(tree_dict.items())
+            for name, value in entries[:MAX_SHOWN_ENTRIES_PER_DIR]:
                 if isinstance(value, dict):
                     # Directory
-                    st.markdown(f"{indent}📁 **{name}**")
-                    sub_selected = render_tree_level(value, level + 1)
-                    if sub_selected:
-                        selected_file = sub_selected
+                    lines.append(f"{indent}📁 **{name}**")
+                    render_tree_level(value, parts + (name,))
                 else:
                     # File
-                    if st.button(f"{indent}📄 {name}", key=f"tree_{value}"):
-                        selected_file = value
+                    lines.append(f"{indent}📄 {name}")
+                    leaves.append(("/".join(parts + (name,)), value))
+
+            if len(entries) > MAX_SHOWN_ENTRIES_PER_DIR:
+                hidden_count = len(entries) - MAX_SHOWN_ENTRIES_PER_DIR
+                lines.append(f"{indent}… {hidden_count} more")
+
+        render_tree_level(file_tree)
+        st.markdown("  \n".join(lines))
+
+        leaf_paths = [full_path for _, full_path in leaves]
+        leaf_names = dict(zip(leaf_paths, (name for name, _ in leaves)))
+        selected_idx = (
+            leaf_paths.index(st.session_state.selected_file)
+            if st.session_state.selected_file in leaf_names
+            else None
+        )
+        return st.radio(
+            "Open File",
+            leaf_paths,
+            index=selected_idx,
+            format_func=lambda path: f"📄 {leaf_names[path]}",
+        )
 
-            return selected_file
+    def _list_dir_shallow(self, version: str, relative_dir: str) -> Dict[str, List]:
+        """List the immediate entries of a directory through the Streamlit cache."""
+        if version == "local":
+            dir_path = Path(self.version_manager.local_dir_path) / relative_dir
+            if not dir_path.is_dir():
+                return {"directories": [], "files": []}
+            return _cached_list_local_dir_shallow(
+                str(self.version_manager.local_dir_path),
+                relative_dir,
+                dir_path.stat().st_mtime,
+            )
 
-        return render_tree_level(file_tree)
+        if not self.gcs_explorer:
+            return {"directories": [], "files": []}
+        return _cached_list_gcs_dir_shallow(
+            self.gcs_explorer,
+            self.version_manager.gcs_bucket_name,
+            self.version_manager.gcs_dir_path,
+            version,
+            relative_dir,
+        )
+
+    def _render_lazy_file_tree(self, version: str) -> Optional[str]:
+        """Render the file tree, only listing the directories that are expanded."""
+        expanded_dirs = st.session_state.expanded_dirs
+        leaves = []
+
+        def render_tree_level(relative_dir: str, level: int = 0) -> None:
+            indent = "  " * level
+            listing = self._list_dir_shallow(version, relative_dir)
+
+            directories = listing["directories"][:MAX_SHOWN_ENTRIES_PER_DIR]
+            for dir_path in directories:
+                is_expanded = dir_path in expanded_dirs
+                icon = "📂" if is_expanded else "📁"
+                if st.button(
+                    f"{indent}{icon} {Path(dir_path).name}",
+                    key=f"tree_dir_{version}_{dir_path}",
+                ):
+                    expanded_dirs.symmetric_difference_update({dir_path})
+                    st.rerun()
+                if is_expanded:
+                    render_tree_level(dir_path, level + 1)
+
+            files = listing["files"][
+                : max(MAX_SHOWN_ENTRIES_PER_DIR - len(directories), 0)
+            ]
+            leaves.extend(files)
+
+            hidden_count = (
+                len(listing["directories"])
+                + len(listing["files"])
+                - len(directories)
+                - len(files)
+            )
+            if hidden_count > 0:
+                st.markdown(f"{indent}… {hidden_count} more")
+
+        render_tree_level("")
+
+        if not leaves:
+            root_listing = self._list_dir_shallow(version, "")
+            if not root_listing["directories"] and not root_listing["files"]:
+                st.info("No files found.")
+            return None
+
+        leaf_paths = [full_path for _, full_path in leaves]
+        leaf_names = dict(zip(leaf_paths, (name for name, _ in leaves)))
+        selected_idx = (
+            leaf_paths.index(st.session_state.selected_file)
+            if st.session_state.selected_file in leaf_names
+            else None
+        )
+        return st.radio(
+            "Open File",
+            leaf_paths,
+            index=selected_idx,
+            format_func=lambda path: f"📄 {leaf_names[path]}",
+        )
 
     def _render_file_browser(self) -> None:
         """Render the enhanced file browser."""
@@ -175,7 +617,7 @@ class PromptDashboard:
         versions = ["local"]
         if st.session_state.gcs_configured and self.version_manager:
             try:
-                gcs_versions = self.version_manager.list_versions()
+                gcs_versions = self._list_versions()
                 versions.extend(gcs_versions)
             except Exception as e:
                 st.warning(f"Could not fetch GCS versions: {e}")
@@ -189,36 +631,62 @@ class PromptDashboard:
         )
         st.session_state.selected_version = selected_version
 
-        # Get files based on version and search
+        # Browse the tree lazily one directory at a time, unless there is a search
+        # query that needs the full listing to filter
+        if st.session_state.show_file_tree and not st.session_state.search_query:
+            selected_file = self._render_lazy_file_tree(selected_version)
+            if selected_file:
+                st.session_state.selected_file = selected_file
+            return
+
+        # Get files based on version and search, matching the query against names
+        # that were lowercased once per listing rather than once per search
+        query_lower = st.session_state.search_query.lower()
         if selected_version == "local":
-            if st.session_state.search_query:
-                files = self.local_explorer.search_files(st.session_state.search_query)
-            else:
-                # Get all local files
-                local_dir = Path(self.version_manager.local_dir_path)
-                files = []
-                if local_dir.exists():
-                    for file_path in local_dir.rglob("*.yaml"):
-                        relative_path = file_path.relative_to(local_dir)
-                        files.append((str(relative_path), str(file_path)))
-                files = sorted(files)
+            local_dir = Path(self.version_manager.local_dir_path)
+            files = []
+            if local_dir.exists():
+                dir_mtime = local_dir.stat().st_mtime
+                if query_lower:
+                    files = [
+                        (name, path)
+                        for name_lower, name, path in _cached_local_search_index(
+                            str(local_dir), dir_mtime
+                        )
+                        if query_lower in name_lower
+                    ]
+                else:
+                    # Get all local files
+                    files = _list_local_yaml(str(local_dir), dir_mtime)
         else:
             # GCS files
             if self.gcs_explorer:
-                gcs_files = self.gcs_explorer.list_files_in_version(selected_version)
-                files = [(f["name"], f["name"]) for f in gcs_files]
-
-                # Apply search filter
-                if st.session_state.search_query:
-                    query_lower = st.session_state.search_query.lower()
+                if query_lower:
                     files = [
                         (name, path)
-                        for name, path in files
-                        if query_lower in name.lower()
+                        for name_lower, name, path in _cached_gcs_search_index(
+                            self.gcs_explorer,
+                            self.version_manager.gcs_bucket_name,
+                            self.version_manager.gcs_dir_path,
+                            selected_version,
+                        )
+                        if query_lower in name_lower
                     ]
+                else:
+                    gcs_files = self._list_files_in_version(selected_version)
+                    files = [(f["name"], f["name"]) for f in gcs_files]
             else:
                 files = []
 
+        # Cap the number of rendered files
+        total_files = len(files)
+        if total_files > MAX_SHOWN_FILES:
+            files = files[:MAX_SHOWN_FILES]
+            st.caption(
+                f"Showing {MAX_SHOWN_FILES} of {total_files} files. "
+                "Refine your search to see more."
+            )
+
         # Render files
         if st.session_state.show_file_tree:
             selected_file = self._render_file_tree(files)
@@ -250,29 +718,47 @@ class PromptDashboard:
                 st.session_state.selected_file = None
 
     def _load_file_content(self, file_path: str, version: str = "local") -> str:
-        """Load file content with enhanced error handling."""
+        """Load the content of a file from the local directory or a GCS version.
+
+        Args:
+            file_path: Path of the file to load
+            version: Version to load the file from, or "local"
+
+        Returns:
+            The file's content
+
+        Raises:
+            ValueError: If the prompt manager or GCS is not set up
+            FileNotFoundError: If the file is not found
+        """
         if not self.version_manager:
-            return "Error: Prompt manager not initialized"
+            raise ValueError("Prompt manager not initialized")
 
-        try:
-            if version == "local":
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return f.read()
-            else:
-                # Load from GCS using the explorer
-                if self.gcs_explorer:
-                    content = self.gcs_explorer.get_file_content_from_gcs(
-                        version, file_path
-                    )
-                    return (
-                        content
-                        if content is not None
-                        else "Error: File not found in GCS"
-                    )
-                else:
-                    return "Error: GCS not configured"
-        except Exception as e:
-            return f"Error loading file: {e}"
+        if version == "local":
+            return _cached_load_local_file(
+                file_path, Path(file_path).stat().st_mtime_ns
+            )
+
+        # Load from GCS using the explorer
+        if not self.gcs_explorer:
+            raise ValueError("GCS not configured")
+        file_info = self._get_gcs_file_info(version, file_path)
+        content = _cached_load_gcs_file(
+            self.gcs_explorer,
+            self.version_manager.gcs_bucket_name,
+            self.version_manager.gcs_dir_path,
+            version,
+            file_path,
+            file_info["etag"] if file_info else None,
+        )
+        if content is None:
+            raise FileNotFoundError("File not found in GCS")
+        return content
+
+    def _forget_loaded_content(self) -> None:
+        """Drop the file contents kept in the session by _render_file_content."""
+        for key in [k for k in st.session_state if str(k).startswith("loaded_")]:
+            del st.session_state[key]
 
     def _render_file_content(self) -> None:
         """Render the file content viewer with enhanced features."""
@@ -292,29 +778,43 @@ class PromptDashboard:
             if st.session_state.selected_version != "local":
                 # Show GCS metadata
                 if self.gcs_explorer:
-                    files = self.gcs_explorer.list_files_in_version(
-                        st.session_state.selected_version
-                    )
-                    file_info = next(
-                        (
-                            f
-                            for f in files
-                            if f["name"] == st.session_state.selected_file
-                        ),
-                        None,
+                    file_info = self._get_gcs_file_info(
+                        st.session_state.selected_version,
+                        st.session_state.selected_file,
                     )
                     if file_info and file_info["size"]:
                         st.info(f"**Size:** {file_info['size']:,} bytes")
 
-        # Load content
-        content = self._load_file_content(
-            st.session_state.selected_file, st.session_state.selected_version
+        # Load content, keeping it in the session so that editor reruns do not read
+        # the file again and only navigating to another file or version does
+        content_key = (
+            f"loaded_{st.session_state.selected_file}"
+            f"@{st.session_state.selected_version}"
+        )
+        if content_key not in st.session_state:
+            self._forget_loaded_content()
+            try:
+                loaded_content = self._load_file_content(
+                    st.session_state.selected_file, st.session_state.selected_version
+                )
+            except Exception as e:
+                # Failed loads are not kept, so the next rerun tries again
+                st.error(f"Error loading file: {e}")
+                return
+            st.session_state[content_key] = loaded_content
+        content = st.session_state[content_key]
+
+        # Content tabs, selected with a radio rather than st.tabs so that only the
+        # active tab is rendered (st.tabs runs the body of every tab)
+        active_tab = st.radio(
+            "View",
+            ["📝 Editor", "🔍 Preview"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="active_tab",
         )
 
-        # Content tabs
-        tab1, tab2 = st.tabs(["📝 Editor", "🔍 Preview"])
-
-        with tab1:
+        if active_tab == "📝 Editor":
             # YAML editor
             edited_content = st_ace(
                 value=content,
@@ -342,6 +842,7 @@ class PromptDashboard:
                                 st.session_state.selected_file, "w", encoding="utf-8"
                             ) as f:
                                 f.write(edited_content)
+                            st.session_state[content_key] = edited_content
                             st.success("File saved successfully!")
                             st.rerun()
                         except Exception as e:
@@ -349,10 +850,10 @@ class PromptDashboard:
                 with col2:
                     st.warning("⚠️ Unsaved changes detected")
 
-        with tab2:
+        else:
             # Structured preview
             try:
-                yaml_data = yaml.safe_load(content)
+                yaml_data = _parse_yaml(content)
                 st.json(yaml_data)
             except yaml.YAMLError as e:
                 st.error(f"Invalid YAML: {e}")
@@ -366,7 +867,7 @@ class PromptDashboard:
 
         st.subheader("🔄 Version Comparison")
 
-        versions = ["local"] + self.version_manager.list_versions()
+        versions = ["local"] + self._list_versions()
 
         col1, col2 = st.columns(2)
         with col1:
@@ -376,23 +877,43 @@ class PromptDashboard:
 
         if version1 != version2 and st.button("Compare Versions"):
             try:
-                comparison = self.gcs_explorer.compare_versions(version1, version2)
+                comparison = _cached_compare_versions(
+                    self.gcs_explorer,
+                    self.version_manager.gcs_bucket_name,
+                    self.version_manager.gcs_dir_path,
+                    version1,
+                    version2,
+                )
 
+                # Render each list as a fixed-height dataframe, which is virtualized
+                # and so stays cheap to render regardless of the size of the diff
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.success(f"**Added ({len(comparison['added'])})**")
-                    for file in comparison["added"]:
-                        st.write(f"+ {file}")
+                    if comparison["added"]:
+                        st.dataframe(
+                            {"File": comparison["added"]},
+                            hide_index=True,
+                            height=300,
+                        )
 
                 with col2:
                     st.error(f"**Removed ({len(comparison['removed'])})**")
-                    for file in comparison["removed"]:
-                        st.write(f"- {file}")
+                    if comparison["removed"]:
+                        st.dataframe(
+                            {"File": comparison["removed"]},
+                            hide_index=True,
+                            height=300,
+                        )
 
                 with col3:
                     st.warning(f"**Modified ({len(comparison['modified'])})**")
-                    for file in comparison["modified"]:
-                        st.write(f"~ {file}")
+                    if comparison["modified"]:
+                        st.dataframe(
+                            {"File": comparison["modified"]},
+                            hide_index=True,
+                            height=300,
+                        )
 
             except Exception as e:
                 st.error(f"Error comparing versions: {e}")
@@ -407,15 +928,21 @@ class PromptDashboard:
 
         # Version overview
         try:
-            versions = self.version_manager.list_versions()
+            versions = self._list_versions()
             if versions:
                 st.write(f"**Available Versions:** {len(versions)}")
 
-                # Show version details in expandable sections
+                # Show version details behind toggles rather than expanders, since
+                # the body of an expander runs even while it is collapsed
                 for version in versions[:5]:  # Show latest 5 versions
-                    with st.expander(f"Version {version}"):
+                    if st.toggle(f"Version {version}", key=f"expanded_{version}"):
                         if self.gcs_explorer:
-                            metadata = self.gcs_explorer.get_version_metadata(version)
+                            metadata = _cached_version_metadata(
+                                self.gcs_explorer,
+                                self.version_manager.gcs_bucket_name,
+                                self.version_manager.gcs_dir_path,
+                                version,
+                            )
                             col1, col2, col3 = st.columns(3)
                             with col1:
                                 st.metric("Files", metadata["file_count"])
@@ -448,6 +975,7 @@ class PromptDashboard:
                     with st.spinner("Creating snapshot..."):
                         # pyrefly: ignore
                         new_version = self.version_manager.save_snapshot(bump_type)
+                    _cached_list_versions.clear()
                     st.success(f"✅ Snapshot created: Version {new_version}")
                     st.rerun()
                 except Exception as e:
@@ -455,9 +983,7 @@ class PromptDashboard:
 
         with col2:
             st.write("**Load Version**")
-            versions = (
-                self.version_manager.list_versions() if self.version_manager else []
-            )
+            versions = self._list_versions() if self.version_manager else []
             if versions:
                 version_to_load = st.selectbox(
                     "Select Version to Load",
@@ -472,6 +998,11 @@ class PromptDashboard:
                                 target_dir = self.version_manager.load_snapshot(
                                     version_to_load, replace=True
                                 )
+                            _list_local_yaml.clear()
+                            _cached_local_search_index.clear()
+                            _cached_file_stats.clear()
+                            _cached_list_local_dir_shallow.clear()
+                            self._forget_loaded_content()
                             st.success(
                                 f"✅ Version {version_to_load} loaded to {target_dir}"
                             )
@@ -499,6 +1030,11 @@ class PromptDashboard:
             st.error("❌ No prompt manager provided to the dashboard.")
             return
 
+        self._init_session_state()
+        self._reset_run_memo()
+        if self._config_error:
+            st.sidebar.error(self._config_error)
+
         # Render sidebar stats
         self._render_sidebar_stats()
 
@@ -535,6 +1071,23 @@ class PromptDashboard:
         )
 
 
+@st.cache_resource(max_entries=8)
+def _get_dashboard(
+    _version_manager: VersionManager, version_manager_id: int
+) -> PromptDashboard:
+    """Construct the dashboard once and share it across Streamlit reruns.
+
+    Args:
+        _version_manager: VersionManager to build the dashboard for (excluded from
+            the cache key)
+        version_manager_id: id() of the VersionManager, used as the cache key
+
+    Returns:
+        PromptDashboard for the given VersionManager
+    """
+    return PromptDashboard(_version_manager)
+
+
 def main(version_manager: VersionManager | None = None):
     """Main entry point for the Streamlit app.
 
@@ -547,7 +1100,7 @@ def main(version_manager: VersionManager | None = None):
         st.info("Please provide a VersionManager instance when calling main().")
         return
 
-    dashboard = PromptDashboard(version_manager)
+    dashboard = _get_dashboard(version_manager, id(version_manager))
     dashboard.run()
 
 
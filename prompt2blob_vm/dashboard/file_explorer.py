@@ -1,5 +1,8 @@
 """Utilities for enhanced GCS integration in the dashboard."""
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -27,11 +30,14 @@ class GCSFileExplorer:
             return []
 
         try:
-            gcs_client = self.version_manager._get_gcs_client()
-            bucket = gcs_client.bucket(self.version_manager.gcs_bucket_name)
+            bucket = self.version_manager._get_gcs_bucket()
 
-            version_prefix = f"{self.version_manager.gcs_dir_path}/Version {version}/"
-            blobs = bucket.list_blobs(prefix=version_prefix)
+            version_prefix = self.version_manager._get_version_prefix(version)
+            # Only request the metadata that is shown
+            blobs = bucket.list_blobs(
+                prefix=version_prefix,
+                fields="items(name,size,updated,contentType,etag),nextPageToken",
+            )
 
             files = []
             for blob in blobs:
@@ -41,21 +47,70 @@ class GCSFileExplorer:
                 # Extract relative path within the version
                 relative_path = blob.name[len(version_prefix) :]
 
-                files.append(
-                    # pyrefly: ignore
-                    {
-                        "name": relative_path,
-                        "full_path": blob.name,
-                        "size": blob.size,
-                        "updated": blob.updated.isoformat() if blob.updated else None,
-                        "content_type": blob.content_type,
-                    }
-                )
+                file_info = {
+                    "name": relative_path,
+                    "full_path": blob.name,
+                    "size": blob.size,
+                    "updated": blob.updated.isoformat() if blob.updated else None,
+                    "content_type": blob.content_type,
+                    "etag": blob.etag,
+                }
+                # pyrefly: ignore
+                files.append(file_info)
 
             return sorted(files, key=lambda x: x["name"])
         except Exception:
             return []
 
+    def list_dir_shallow(
+        self, version: str, relative_dir: str = ""
+    ) -> Dict[str, List[Any]]:
+        """
+        List only the immediate entries of a directory in a specific GCS version.
+
+        Args:
+            version: Version string (e.g., "1.0.0")
+            relative_dir: Directory path relative to the version root ("" for the root)
+
+        Returns:
+            Dictionary with the relative paths of the subdirectories, and tuples
+            (display_name, full_path) of the files
+        """
+        listing = {"directories": [], "files": []}
+        if not self.version_manager.gcs_bucket_name:
+            return listing
+
+        try:
+            bucket = self.version_manager._get_gcs_bucket()
+
+            version_prefix = self.version_manager._get_version_prefix(version)
+            prefix = (
+                f"{version_prefix}{relative_dir}/" if relative_dir else version_prefix
+            )
+            blobs = bucket.list_blobs(
+                prefix=prefix,
+                delimiter="/",
+                fields="items(name),prefixes,nextPageToken",
+            )
+
+            for blob in blobs:
+                if blob.name.endswith("/"):  # Skip directory markers
+                    continue
+                relative_path = blob.name[len(version_prefix) :]
+                listing["files"].append((relative_path, relative_path))
+
+            # Prefixes are only populated once the blobs have been iterated over
+            for dir_prefix in blobs.prefixes:
+                listing["directories"].append(
+                    dir_prefix[len(version_prefix) :].rstrip("/")
+                )
+        except Exception:
+            return {"directories": [], "files": []}
+
+        listing["directories"].sort()
+        listing["files"].sort()
+        return listing
+
     def get_file_content_from_gcs(self, version: str, file_path: str) -> Optional[str]:
         """
         Get file content directly from GCS.
@@ -71,17 +126,16 @@ class GCSFileExplorer:
             return None
 
         try:
-            gcs_client = self.version_manager._get_gcs_client()
-            bucket = gcs_client.bucket(self.version_manager.gcs_bucket_name)
+            bucket = self.version_manager._get_gcs_bucket()
 
             gcs_file_path = (
-                f"{self.version_manager.gcs_dir_path}/Version {version}/{file_path}"
+                self.version_manager._get_version_prefix(version) + file_path
             )
             blob = bucket.blob(gcs_file_path)
 
-            if blob.exists():
-                return blob.download_as_text(encoding="utf-8")
-            return None
+            # Download without checking that the blob exists first, which would
+            # cost an extra request, as a missing blob raises NotFound anyway
+            return blob.download_as_text(encoding="utf-8")
         except Exception:
             return None
 
@@ -105,18 +159,26 @@ class GCSFileExplorer:
                 "file_types": [],
             }
 
-        total_size = sum(f["size"] or 0 for f in files)
-        last_updated = max((f["updated"] for f in files if f["updated"]), default=None)
+        # Aggregate everything in a single pass over the files
+        total_size = 0
+        last_updated = None
+        file_types = set()
+        for f in files:
+            total_size += f["size"] or 0
+
+            updated = f["updated"]
+            if updated and (last_updated is None or updated > last_updated):
+                last_updated = updated
 
-        file_types = list(
-            set(Path(f["name"]).suffix.lower() for f in files if Path(f["name"]).suffix)
-        )
+            ext = os.path.splitext(f["name"])[1]
+            if len(ext) > 1:
+                file_types.add(ext.lower())
 
         return {
             "file_count": len(files),
             "total_size": total_size,
             "last_updated": last_updated,
-            "file_types": file_types,
+            "file_types": list(file_types),
         }
 
     def compare_versions(self, version1: str, version2: str) -> Dict[str, List[str]]:
@@ -130,22 +192,39 @@ class GCSFileExplorer:
         Returns:
             Dictionary with added, removed, and modified files
         """
-        files1 = {f["name"]: f for f in self.list_files_in_version(version1)}
-        files2 = {f["name"]: f for f in self.list_files_in_version(version2)}
-
-        added = list(set(files2.keys()) - set(files1.keys()))
-        removed = list(set(files1.keys()) - set(files2.keys()))
-
-        # Check for modified files (size difference as a simple heuristic)
-        modified = []
-        for name in set(files1.keys()) & set(files2.keys()):
-            if files1[name]["size"] != files2[name]["size"]:
-                modified.append(name)
+        # List both versions concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(self.list_files_in_version, version1)
+            future2 = executor.submit(self.list_files_in_version, version2)
+            files1 = future1.result()
+            files2 = future2.result()
+
+        # Both listings are sorted by name, so walk them side by side in one pass,
+        # which also keeps the results sorted
+        added, removed, modified = [], [], []
+        i = j = 0
+        while i < len(files1) and j < len(files2):
+            name1 = files1[i]["name"]
+            name2 = files2[j]["name"]
+            if name1 == name2:
+                # Check for modified files (size difference as a simple heuristic)
+                if files1[i]["size"] != files2[j]["size"]:
+                    modified.append(name1)
+                i += 1
+                j += 1
+            elif name1 < name2:
+                removed.append(name1)
+                i += 1
+            else:
+                added.append(name2)
+                j += 1
+        removed.extend(f["name"] for f in files1[i:])
+        added.extend(f["name"] for f in files2[j:])
 
         return {
-            "added": sorted(added),
-            "removed": sorted(removed),
-            "modified": sorted(modified),
+            "added": added,
+            "removed": removed,
+            "modified": modified,
         }
 
 
@@ -166,30 +245,69 @@ class LocalFileExplorer:
         if not self.local_dir.exists():
             return {}
 
-        def build_tree(path: Path) -> Dict[str, Any]:
+        def build_tree(path: str) -> Dict[str, Any]:
             tree = {"type": "directory", "children": {}}
 
             try:
-                for item in sorted(path.iterdir()):
-                    if item.is_file() and item.suffix.lower() in [".yaml", ".yml"]:
+                # Directory entries know their type, so only files need a stat call
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith(
+                        (".yaml", ".yml")
+                    ):
+                        stat = entry.stat()
                         # pyrefly: ignore
-                        tree["children"][item.name] = {
+                        tree["children"][entry.name] = {
                             "type": "file",
-                            "path": str(item),
-                            "size": item.stat().st_size,
-                            "modified": item.stat().st_mtime,
+                            "path": entry.path,
+                            "size": stat.st_size,
+                            "modified": stat.st_mtime,
                         }
-                    elif item.is_dir() and not item.name.startswith("."):
-                        subtree = build_tree(item)
+                    elif entry.is_dir() and not entry.name.startswith("."):
+                        subtree = build_tree(entry.path)
                         if subtree["children"]:  # Only include non-empty directories
                             # pyrefly: ignore
-                            tree["children"][item.name] = subtree
+                            tree["children"][entry.name] = subtree
             except PermissionError:
                 pass
 
             return tree
 
-        return build_tree(self.local_dir)
+        return build_tree(str(self.local_dir))
+
+    def list_dir_shallow(self, relative_dir: str = "") -> Dict[str, List[Any]]:
+        """
+        List only the immediate entries of a local directory.
+
+        Args:
+            relative_dir: Directory path relative to the local root ("" for the root)
+
+        Returns:
+            Dictionary with the relative paths of the subdirectories, and tuples
+            (display_name, full_path) of the YAML files
+        """
+        listing = {"directories": [], "files": []}
+
+        try:
+            entries = list(os.scandir(self.local_dir / relative_dir))
+        except (OSError, PermissionError):
+            return listing
+
+        for entry in entries:
+            relative_path = os.path.join(relative_dir, entry.name)
+            try:
+                if entry.is_dir() and not entry.name.startswith("."):
+                    listing["directories"].append(relative_path)
+                elif entry.is_file() and entry.name.endswith(".yaml"):
+                    listing["files"].append((relative_path, entry.path))
+            except OSError:
+                continue
+
+        listing["directories"].sort()
+        listing["files"].sort()
+        return listing
 
     def search_files(self, query: str) -> List[Tuple[str, str]]:
         """
@@ -204,15 +322,31 @@ class LocalFileExplorer:
         if not self.local_dir.exists():
             return []
 
-        query_lower = query.lower()
+        # Match case-insensitively without lowercasing every path
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
         matches = []
 
-        for file_path in self.local_dir.rglob("*.yaml"):
-            relative_path = file_path.relative_to(self.local_dir)
-            display_name = str(relative_path)
+        pending = [(str(self.local_dir), "")]
+        while pending:
+            dir_path, relative_dir = pending.pop()
+            try:
+                entries = list(os.scandir(dir_path))
+            except (OSError, PermissionError):
+                continue
 
-            if query_lower in display_name.lower():
-                matches.append((display_name, str(file_path)))
+            for entry in entries:
+                relative_path = os.path.join(relative_dir, entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, relative_path))
+                    elif (
+                        entry.name.endswith(".yaml")
+                        and entry.is_file()
+                        and pattern.search(relative_path)
+                    ):
+                        matches.append((relative_path, entry.path))
+                except OSError:
+                    continue
 
         return sorted(matches)
 
@@ -236,21 +370,40 @@ class LocalFileExplorer:
         file_types = {}
         directories = set()
 
-        for file_path in self.local_dir.rglob("*"):
-            if file_path.is_file():
+        # Walk with os.scandir so that each file is stat-ed at most once, as
+        # opposed to the separate is_file() and stat() calls of Path.rglob
+        pending = [(str(self.local_dir), ".")]
+        while pending:
+            dir_path, relative_dir = pending.pop()
+            try:
+                entries = list(os.scandir(dir_path))
+            except (OSError, PermissionError):
+                continue
+
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(
+                            (entry.path, os.path.join(relative_dir, entry.name))
+                        )
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
                 total_files += 1
                 try:
-                    size = file_path.stat().st_size
-                    total_size += size
+                    total_size += entry.stat().st_size
 
-                    ext = file_path.suffix.lower()
+                    ext = os.path.splitext(entry.name)[1].lower()
                     if ext:
                         file_types[ext] = file_types.get(ext, 0) + 1
                 except (OSError, PermissionError):
                     pass
 
                 # Track directories
-                directories.add(str(file_path.parent.relative_to(self.local_dir)))
+                directories.add(os.path.normpath(relative_dir))
 
         return {
             "total_files": total_files,
@@ -1,11 +1,44 @@
 """Demo script showing VersionManager usage with the existing prompt structure."""
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
 from prompt2blob_vm.version_manager import VersionManager
 
+# Directory containing the prompts/ folder used by the demos
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=256)
+def _demo_brand_prefix(brand_name: str) -> str:
+    """Return the directory prefix for a brand, memoized by brand name."""
+    brand_slug = brand_name.lower().replace(" ", "_")
+
+    if brand_slug == "generic":
+        return "generic/"
+
+    # Map brand names to existing folder structure
+    return f"customized/brand_{brand_slug}/"
+
+
+@lru_cache(maxsize=1024)
+def _resolve_demo_path(keys: Tuple[str, ...]) -> str:
+    """Resolve [brand_name, metric_name] keys to a file path, memoized by keys."""
+    if len(keys) != 2:
+        raise ValueError("Expected exactly 2 keys: [brand_name, metric_name]")
+
+    brand_name, metric_name = keys
+
+    # Normalize metric name (assuming metric_1 pattern)
+    metric_file = f"{metric_name.lower().replace(' ', '_')}.yaml"
+
+    return _demo_brand_prefix(brand_name) + metric_file
+
 
 class DemoPromptManager(VersionManager):
     """Demo implementation matching the existing prompt structure."""
@@ -23,20 +56,18 @@ class DemoPromptManager(VersionManager):
         Args:
             keys: [brand_name, metric_name] or ["generic", metric_name]
         """
-        if len(keys) != 2:
-            raise ValueError("Expected exactly 2 keys: [brand_name, metric_name]")
-
-        brand_name, metric_name = keys
+        # Lists are not hashable, so the keys are passed to the cache as a tuple
+        return _resolve_demo_path(tuple(keys))
 
-        # Normalize metric name (assuming metric_1 pattern)
-        metric_file = f"{metric_name.lower().replace(' ', '_')}.yaml"
 
-        if brand_name.lower() == "generic":
-            return f"generic/{metric_file}"
-        else:
-            # Map brand names to existing folder structure
-            brand_folder = f"brand_{brand_name.lower().replace(' ', '_')}"
-            return f"customized/{brand_folder}/{metric_file}"
+@lru_cache(maxsize=1)
+def _get_gcs_demo_manager() -> DemoPromptManager:
+    """Get the GCS-backed manager shared by the GCS demos, created on first use."""
+    return DemoPromptManager(
+        local_dir_path="prompts",
+        gcs_bucket_name="bai-buchai-p-stb-usea1-creations",
+        gcs_dir_path="tmp/prompt-artifacts/",
+    )
 
 
 def demo_load_prompt_local():
@@ -54,16 +85,23 @@ def demo_load_prompt_local():
         (["3", "metric_1"], "Brand 3 customized prompt"),
     ]
 
-    for keys, description in test_cases:
+    def load(keys: List[str]) -> Tuple[Dict[str, Any], str]:
+        prompt = manager.load_prompt(keys=keys, version="local")
+        # Also test getting as string
+        prompt_string = manager.load_prompt_as_str(keys=keys, version="local")
+        return prompt, prompt_string
+
+    # Read the files concurrently, but report the results in test case order
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        futures = [executor.submit(load, keys) for keys, _ in test_cases]
+
+    for (keys, description), future in zip(test_cases, futures):
         try:
-            prompt = manager.load_prompt(keys=keys, version="local")
+            prompt, prompt_string = future.result()
             print(f"\n✅ {description}:")
             print(f"   Keys: {keys}")
             print(f"   File path: {manager.get_prompt_file_path(keys)}")
             print(f"   Content: {prompt}")
-
-            # Also test getting as string
-            prompt_string = manager.load_prompt_as_str(keys=keys, version="local")
             print(f"   As string (first 100 chars): {prompt_string[:100]}...")
 
         except FileNotFoundError as e:
@@ -78,11 +116,7 @@ def demo_load_prompt_versioned():
 
     try:
         # Initialize manager with the specified GCS bucket
-        manager = DemoPromptManager(
-            local_dir_path="prompts",
-            gcs_bucket_name="bai-buchai-p-stb-usea1-creations",
-            gcs_dir_path="tmp/prompt-artifacts/",
-        )
+        manager = _get_gcs_demo_manager()
 
         print("✅ GCS Manager initialized successfully")
         print("   Bucket: bai-buchai-p-stb-usea1-creations")
@@ -144,13 +178,12 @@ def demo_load_snapshot():
     """Demonstrate loading snapshots from GCS to local directories."""
     print("\n=== Demo: Load Snapshot Functionality ===")
 
+    # Timestamp shared by every target directory created in this demo run
+    session_ts = datetime.now().strftime("%Y%m%d%H%M%S")
+
     try:
         # Initialize manager with the specified GCS bucket
-        manager = DemoPromptManager(
-            local_dir_path="prompts",
-            gcs_bucket_name="bai-buchai-p-stb-usea1-creations",
-            gcs_dir_path="tmp/prompt-artifacts/",
-        )
+        manager = _get_gcs_demo_manager()
 
         print("✅ GCS Manager initialized for snapshot loading")
 
@@ -177,22 +210,19 @@ def demo_load_snapshot():
         try:
             snapshot_dir = manager.load_snapshot(
                 version=latest_version,
-                target_dir=f"output/prompts/{datetime.now().strftime('%Y%m%d%H%M%S')}",
+                target_dir=f"output/prompts/{session_ts}",
                 replace=False,
             )
             print(f"✅ Successfully downloaded snapshot to: {snapshot_dir}")
 
             # Verify the download by listing files
-            import os
-
-            if os.path.exists(snapshot_dir):
-                files = []
-                for root, dirs, filenames in os.walk(snapshot_dir):
-                    for filename in filenames:
-                        rel_path = os.path.relpath(
-                            os.path.join(root, filename), snapshot_dir
-                        )
-                        files.append(rel_path)
+            snapshot_root = Path(snapshot_dir)
+            if snapshot_root.exists():
+                files = [
+                    str(file_path.relative_to(snapshot_root))
+                    for file_path in snapshot_root.rglob("*")
+                    if file_path.is_file()
+                ]
                 print(f"   Downloaded files: {files}")
 
         except FileExistsError:
@@ -217,7 +247,7 @@ def demo_load_snapshot():
         try:
             snapshot_dir = manager.load_snapshot(
                 version="latest",
-                target_dir=f"output/prompts/{datetime.now().strftime('%Y%m%d%H%M%S')}",
+                target_dir=f"output/prompts/{session_ts}_latest",
                 replace=False,
             )
             print(f"✅ Successfully downloaded latest snapshot to: {snapshot_dir}")
@@ -239,14 +269,13 @@ def demo_load_snapshot():
             print(f"   📁 Prompts directory location: {snapshot_dir}")
 
             # Verify the replacement by listing files
-            if os.path.exists(snapshot_dir):
-                files = []
-                for root, dirs, filenames in os.walk(snapshot_dir):
-                    for filename in filenames:
-                        rel_path = os.path.relpath(
-                            os.path.join(root, filename), snapshot_dir
-                        )
-                        files.append(rel_path)
+            snapshot_root = Path(snapshot_dir)
+            if snapshot_root.exists():
+                files = [
+                    str(file_path.relative_to(snapshot_root))
+                    for file_path in snapshot_root.rglob("*")
+                    if file_path.is_file()
+                ]
                 print(f"   📋 Files in replaced directory: {files}")
 
         except Exception as e:
@@ -295,9 +324,15 @@ def demo_load_snapshot():
 
 if __name__ == "__main__":
     # Change to the project root directory for the demo
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    os.chdir(project_root)
-
-    demo_load_prompt_local()
-    demo_load_prompt_versioned()
-    demo_load_snapshot()
+    os.chdir(_PROJECT_ROOT)
+
+    # Buffer the many small prints of each demo and flush once per demo
+    sys.stdout.reconfigure(line_buffering=False)
+
+    for demo in (
+        demo_load_prompt_local,
+        demo_load_prompt_versioned,
+        demo_load_snapshot,
+    ):
+        demo()
+        sys.stdout.flush()
@@ -1,9 +1,66 @@
 """Example implementations of VersionManager for different use cases."""
 
-from typing import List
+import string
+from functools import lru_cache
+from typing import List, Tuple
 
 from prompt2blob_vm.version_manager import VersionManager
 
+# Lowercases ASCII letters and maps separators to underscores in a single pass
+_SLUG_TABLE = str.maketrans(
+    {" ": "_", "-": "_", **{c: c.lower() for c in string.ascii_uppercase}}
+)
+
+
+def _normalize_name(name: str) -> str:
+    """Convert a name to a file-system friendly slug."""
+    slug = name.translate(_SLUG_TABLE)
+    # The table only covers ASCII letters, so fall back to str.lower() otherwise
+    return slug if slug.isascii() else slug.lower()
+
+
+@lru_cache(maxsize=256)
+def _brand_prefix(brand_name: str) -> str:
+    """Return the directory prefix for a brand, memoized by brand name."""
+    brand_slug = _normalize_name(brand_name)
+
+    # Check if this is a generic prompt request
+    if brand_slug == "generic":
+        return "generic/"
+
+    # Return customized brand-specific directory
+    return f"customized/{brand_slug}/"
+
+
+@lru_cache(maxsize=1024)
+def _resolve_brand_metric_path(keys: Tuple[str, ...]) -> str:
+    """Resolve [brand_name, metric_name] keys to a file path, memoized by keys."""
+    if len(keys) != 2:
+        raise ValueError("Expected exactly 2 keys: [brand_name, metric_name]")
+
+    brand_name, metric_name = keys
+
+    # Only the metric needs normalizing for a new combination of known brands
+    return f"{_brand_prefix(brand_name)}{_normalize_name(metric_name)}.yaml"
+
+
+@lru_cache(maxsize=1024)
+def _resolve_hierarchical_path(keys: Tuple[str, ...]) -> str:
+    """Resolve hierarchical keys to a file path, memoized by keys."""
+    if not keys:
+        raise ValueError("At least one key is required")
+
+    # Normalize all keys for file paths
+    normalized_keys = [_normalize_name(key) for key in keys]
+
+    # Last key becomes the filename, others become directory structure
+    if len(normalized_keys) == 1:
+        return f"{normalized_keys[0]}.yaml"
+    else:
+        directories = "/".join(normalized_keys[:-1])
+        filename = normalized_keys[-1]
+        return f"{directories}/{filename}.yaml"
+
 
 class BrandMetricPromptManager(VersionManager):
     """
@@ -27,25 +84,8 @@ class BrandMetricPromptManager(VersionManager):
             ["Goldman Sachs", "TVPI"] -> "customized/goldman_sachs/tvpi.yaml"
             ["Generic", "TVPI"] -> "generic/tvpi.yaml"
         """
-        if len(keys) != 2:
-            raise ValueError("Expected exactly 2 keys: [brand_name, metric_name]")
-
-        brand_name, metric_name = keys
-
-        # Normalize names for file paths
-        brand_slug = self._normalize_name(brand_name)
-        metric_slug = self._normalize_name(metric_name)
-
-        # Check if this is a generic prompt request
-        if brand_name.lower() == "generic":
-            return f"generic/{metric_slug}.yaml"
-
-        # Return customized brand-specific path
-        return f"customized/{brand_slug}/{metric_slug}.yaml"
-
-    def _normalize_name(self, name: str) -> str:
-        """Convert a name to a file-system friendly slug."""
-        return name.lower().replace(" ", "_").replace("-", "_")
+        # Lists are not hashable, so the keys are passed to the cache as a tuple
+        return _resolve_brand_metric_path(tuple(keys))
 
 
 class HierarchicalPromptManager(VersionManager):
@@ -69,23 +109,8 @@ class HierarchicalPromptManager(VersionManager):
             ["finance", "metrics", "tvpi"] -> "finance/metrics/tvpi.yaml"
             ["marketing", "campaigns"] -> "marketing/campaigns.yaml"
         """
-        if not keys:
-            raise ValueError("At least one key is required")
-
-        # Normalize all keys for file paths
-        normalized_keys = [self._normalize_name(key) for key in keys]
-
-        # Last key becomes the filename, others become directory structure
-        if len(normalized_keys) == 1:
-            return f"{normalized_keys[0]}.yaml"
-        else:
-            directories = "/".join(normalized_keys[:-1])
-            filename = normalized_keys[-1]
-            return f"{directories}/{filename}.yaml"
-
-    def _normalize_name(self, name: str) -> str:
-        """Convert a name to a file-system friendly slug."""
-        return name.lower().replace(" ", "_").replace("-", "_")
+        # Lists are not hashable, so the keys are passed to the cache as a tuple
+        return _resolve_hierarchical_path(tuple(keys))
 
 
 # Example usage functions
@@ -1,14 +1,120 @@
 """VersionManager class for managing prompts locally and in Google Cloud Storage."""
 
+import base64
+import copy
 import fnmatch
+import io
+import mmap
+import os
+import pickle
+import re
 import shutil
+import tarfile
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
-
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from pathlib import Path, PurePosixPath
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import google_crc32c
 import yaml
-from google.cloud import storage
-from packaging import version
+
+if TYPE_CHECKING:
+    # The GCS client library is slow to import, so it is only imported at runtime
+    # once a manager actually uses GCS
+    from google.cloud import storage
+
+# Blobs larger than this are transferred as concurrent ranged requests or parts
+LARGE_BLOB_SIZE = 64 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Name of the single archive blob within a version folder of a bundled snapshot
+SNAPSHOT_BUNDLE_NAME = "snapshot.tar.gz"
+
+# Version folder names, as created by save_snapshot (e.g., "1.2.3")
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+# Use the libyaml-backed loader and dumper when PyYAML was built with them, as they
+# are much faster than the pure Python ones
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Size of the HTTP connection pool of the shared GCS clients, large enough for the
+# concurrent transfers of snapshot operations
+GCS_HTTP_POOL_SIZE = 64
+
+
+@lru_cache(maxsize=None)
+def _get_shared_gcs_client(gcs_credentials_path: Optional[str]) -> "storage.Client":
+    """
+    Get a GCS client shared by all managers using the same credentials.
+
+    Creating a client resolves credentials and sets up a new connection pool, so
+    managers reuse one client per credentials file instead.
+
+    Args:
+        gcs_credentials_path: Path to GCS credentials JSON file, or None for the
+                              default credentials
+
+    Returns:
+        storage.Client: The Google Cloud Storage client instance
+    """
+    import requests
+    from google.cloud import storage
+
+    if gcs_credentials_path:
+        client = storage.Client.from_service_account_json(gcs_credentials_path)
+    else:
+        client = storage.Client()
+
+    # Only resize the default adapter, leaving any custom one (e.g. for mTLS) alone
+    if type(client._http.get_adapter("https://")) is requests.adapters.HTTPAdapter:
+        client._http.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=GCS_HTTP_POOL_SIZE, pool_maxsize=GCS_HTTP_POOL_SIZE
+            ),
+        )
+
+    return client
+
+
+@lru_cache(maxsize=32)
+def _compile_ignore_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile ignore_files patterns into a single regular expression.
+
+    The expression matches the same paths as calling fnmatch.fnmatch with each
+    pattern, so that every path is checked with one match call.
+
+    Args:
+        patterns: Glob patterns to combine
+
+    Returns:
+        re.Pattern[str]: Expression to match against os.path.normcase(path)
+    """
+    return re.compile(
+        "|".join(
+            f"(?:{fnmatch.translate(os.path.normcase(pattern))})"
+            for pattern in patterns
+        )
+    )
 
 
 class VersionManager(ABC):
@@ -27,6 +133,11 @@ class VersionManager(ABC):
         gcs_dir_path: Optional[str] = None,
         gcs_credentials_path: Optional[str] = None,
         ignore_files: Optional[List[str]] = None,
+        max_workers: int = 16,
+        bundle_snapshots: bool = False,
+        versions_cache_ttl: float = 30.0,
+        prompt_cache_size: int = 256,
+        prompt_index_path: Optional[str] = None,
     ):
         """
         Initialize the VersionManager.
@@ -37,25 +148,70 @@ class VersionManager(ABC):
             gcs_dir_path: Path within the GCS bucket to store versioned prompt folders
             gcs_credentials_path: Path to GCS credentials JSON file (optional)
             ignore_files: List of file patterns to ignore during snapshot operations (optional)
+            max_workers: Maximum number of concurrent GCS transfers during snapshot operations (default: 16)
+            bundle_snapshots: If True, save snapshots as a single tar.gz blob instead of one blob per file (default: False)
+            versions_cache_ttl: Number of seconds to reuse the result of list_versions for, or 0 to disable (default: 30)
+            prompt_cache_size: Maximum number of parsed prompts to keep in memory, or 0 to disable (default: 256)
+            prompt_index_path: Path of a pickle file to keep the parsed local prompts in across restarts, which must not be writable by untrusted users and must be outside local_dir_path (optional)
+
+        Raises:
+            ValueError: If prompt_index_path is inside local_dir_path
         """
         self.local_dir_path = Path(local_dir_path)
         self.gcs_bucket_name = gcs_bucket_name
         self.gcs_dir_path = gcs_dir_path.rstrip("/") if gcs_dir_path else None
         self.ignore_files = ignore_files or []
+        self.max_workers = max_workers
+        self.bundle_snapshots = bundle_snapshots
+        self.versions_cache_ttl = versions_cache_ttl
+        self.prompt_cache_size = prompt_cache_size
+        self.prompt_index_path = Path(prompt_index_path) if prompt_index_path else None
+        # An index inside the prompts directory would be uploaded with the snapshots,
+        # and loading a snapshot would then unpickle a file that came from GCS
+        if (
+            self.prompt_index_path is not None
+            and self.prompt_index_path.resolve().is_relative_to(
+                self.local_dir_path.resolve()
+            )
+        ):
+            raise ValueError("prompt_index_path must be outside local_dir_path")
 
-        # Initialize GCS client if bucket is provided
-        self._gcs_client = None
-        if gcs_bucket_name:
-            if gcs_credentials_path:
-                self._gcs_client = storage.Client.from_service_account_json(
-                    gcs_credentials_path
-                )
-            else:
-                self._gcs_client = storage.Client()
+        # Result of the last list_versions call, with the time it was listed at
+        self._versions_cache: Optional[Tuple[float, List[str]]] = None
 
-    def _get_gcs_client(self) -> storage.Client:
+        # Parsed prompts, least recently used first. GCS prompts are keyed by
+        # (version, file path), as saved versions are never modified. Local prompts
+        # are also keyed by the file's mtime and size, so edits are picked up.
+        self._prompt_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = (
+            OrderedDict()
+        )
+        # Full prompts formatted by load_prompt_as_str, keyed by the id of the cached
+        # prompt they were formatted from. The prompt is kept with its string, so its
+        # id cannot be reused by another prompt while the entry exists.
+        self._formatted_prompt_cache: "OrderedDict[int, Tuple[Dict[str, Any], str]]" = (
+            OrderedDict()
+        )
+        # Files in the archive of each version known to be saved as a bundle, whose
+        # prompts are read from the archive without trying the per-file blob first
+        self._bundled_versions: Dict[str, Set[str]] = {}
+        # Serializes downloads of bundles, so that concurrent loads share one download
+        self._bundle_lock = threading.Lock()
+        # Local prompts loaded from the prompt index file, keyed like the prompt
+        # cache. These are kept apart from the prompt cache, so that loading the index
+        # of a large tree doesn't evict the prompts that are actually in use.
+        self._prompt_index: Dict[Tuple[Any, ...], Any] = {}
+        # Whether the prompt index file has been loaded yet
+        self._prompt_index_loaded = False
+
+        # The GCS client is only created on first use, so that managers which never
+        # touch GCS don't resolve credentials
+        self.gcs_credentials_path = gcs_credentials_path
+        self._gcs_client: Optional["storage.Client"] = None
+        self._gcs_bucket: Optional["storage.Bucket"] = None
+
+    def _get_gcs_client(self) -> "storage.Client":
         """
-        Get GCS client.
+        Get GCS client, created on first use.
 
         Returns:
             storage.Client: The Google Cloud Storage client instance
@@ -63,15 +219,42 @@ class VersionManager(ABC):
         Raises:
             ValueError: If GCS configuration is not properly set up
         """
-        if (
-            self._gcs_client is None
-            or not self.gcs_bucket_name
-            or not self.gcs_dir_path
-        ):
+        if not self.gcs_bucket_name or not self.gcs_dir_path:
             raise ValueError("GCS configuration required for this operation")
 
+        if self._gcs_client is None:
+            self._gcs_client = _get_shared_gcs_client(self.gcs_credentials_path)
         return self._gcs_client
 
+    def _get_gcs_bucket(self) -> "storage.Bucket":
+        """
+        Get GCS bucket handle, created once per client.
+
+        Returns:
+            storage.Bucket: The Google Cloud Storage bucket instance
+
+        Raises:
+            ValueError: If GCS configuration is not properly set up
+        """
+        gcs_client = self._get_gcs_client()
+
+        if self._gcs_bucket is None or self._gcs_bucket.client is not gcs_client:
+            self._gcs_bucket = gcs_client.bucket(self.gcs_bucket_name)
+
+        return self._gcs_bucket
+
+    def _get_version_prefix(self, version: str) -> str:
+        """
+        Get the GCS path prefix of a version folder.
+
+        Args:
+            version: Version number (e.g., "1.0.0")
+
+        Returns:
+            str: Prefix of the blobs in the version folder, ending with a slash
+        """
+        return f"{self.gcs_dir_path}/Version {version}/"
+
     def _should_ignore_file(self, file_path: Path) -> bool:
         """
         Check if a file should be ignored based on the ignore_files patterns.
@@ -82,17 +265,36 @@ class VersionManager(ABC):
         Returns:
             bool: True if the file should be ignored, False otherwise
         """
-        if not self.ignore_files:
-            return False
+        relative_path = os.path.relpath(file_path, self.local_dir_path)
+        return self._should_ignore_gcs_path(Path(relative_path).as_posix())
 
-        # Convert to string and use relative path for pattern matching
-        file_str = str(file_path.relative_to(self.local_dir_path))
+    def _iter_local_files(self) -> Iterator[Tuple[os.DirEntry, str]]:
+        """
+        Walk the local prompts directory for the files that are not ignored.
 
-        for pattern in self.ignore_files:
-            if fnmatch.fnmatch(file_str, pattern):
-                return True
+        The directory entries returned by os.scandir already know their type, so
+        unlike Path.rglob no extra stat call is needed per entry. Symlinked
+        directories are not followed. A missing prompts directory has no files.
 
-        return False
+        Yields:
+            Tuple[os.DirEntry, str]: Directory entry of each file, with its path
+                                     relative to the prompts directory using "/"
+        """
+        if not self.local_dir_path.is_dir():
+            return
+
+        pending_dirs = [(str(self.local_dir_path), "")]
+        while pending_dirs:
+            dir_path, relative_dir = pending_dirs.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    relative_path = f"{relative_dir}{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append((entry.path, f"{relative_path}/"))
+                    elif entry.is_file() and not self._should_ignore_gcs_path(
+                        relative_path
+                    ):
+                        yield entry, relative_path
 
     def _should_ignore_gcs_path(self, relative_path: str) -> bool:
         """
@@ -107,16 +309,16 @@ class VersionManager(ABC):
         if not self.ignore_files:
             return False
 
-        for pattern in self.ignore_files:
-            if fnmatch.fnmatch(relative_path, pattern):
-                return True
-
-        return False
+        ignore_pattern = _compile_ignore_patterns(tuple(self.ignore_files))
+        return ignore_pattern.match(os.path.normcase(relative_path)) is not None
 
     def _load_local_prompt(self, keys: List[str]) -> Dict[str, Any]:
         """
         Load prompt from local directory.
 
+        The returned dictionary may be shared with the prompt cache, so it must not be
+        modified.
+
         Args:
             keys: List of keys identifying the prompt
 
@@ -126,19 +328,140 @@ class VersionManager(ABC):
         Raises:
             FileNotFoundError: If the prompt file is not found in the local directory
         """
+        if self.prompt_index_path is not None and not self._prompt_index_loaded:
+            self._load_prompt_index()
+
         file_path = self.get_prompt_file_path(keys)
-        full_path = self.local_dir_path / file_path
+        # Join as strings and stat once, which is cheaper than building a Path
+        full_path = os.path.join(self.local_dir_path, file_path)
+
+        try:
+            stat = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            # A path component that is a file also means the prompt doesn't exist
+            raise FileNotFoundError(f"Prompt file not found: {full_path}") from None
+
+        cache_key = ("local", file_path, stat.st_mtime_ns, stat.st_size)
+        prompt_data = self._get_cached_prompt(cache_key)
+        if prompt_data is not None:
+            return prompt_data
 
-        if not full_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {full_path}")
+        prompt_data = self._prompt_index.get(cache_key)
+        if prompt_data is not None:
+            return prompt_data
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        prompt_data = self._parse_local_file(full_path, stat.st_size)
+
+        self._cache_prompt(cache_key, prompt_data)
+        return prompt_data
+
+    def _parse_local_file(self, file_path: str, file_size: int) -> Any:
+        """
+        Parse a local YAML file.
+
+        Args:
+            file_path: Path of the file to parse
+            file_size: Size of the file in bytes
+
+        Returns:
+            Any: The parsed YAML content
+        """
+        with open(file_path, "rb") as f:
+            if file_size == 0:
+                # Empty files cannot be memory-mapped
+                return yaml.load(f, Loader=YAML_LOADER)
+
+            # Hand the raw bytes to the parser without reading and decoding the file
+            # into an intermediate string first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=YAML_LOADER)
+
+    def _load_prompt_index(self) -> None:
+        """
+        Load the local prompts saved in the prompt index file.
+
+        The index holds every local YAML file parsed, keyed like the prompt cache by
+        the file's path, mtime and size. Files that changed since the index was saved
+        are parsed again, and the index file is then rewritten, so a restart only
+        parses the files that changed.
+        """
+        self._prompt_index_loaded = True
+        index_path = self.prompt_index_path
+        if (
+            index_path is None
+            or self.prompt_cache_size <= 0
+            or not self.local_dir_path.is_dir()
+        ):
+            return
+
+        saved_index = {}
+        try:
+            with open(index_path, "rb") as f:
+                saved_index = pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Rebuild an unreadable index from scratch
+            saved_index = {}
+        if not isinstance(saved_index, dict):
+            saved_index = {}
+
+        index = {}
+        for entry, relative_path in self._iter_local_files():
+            if not relative_path.endswith((".yaml", ".yml")):
+                continue
+
+            stat = entry.stat()
+            cache_key = ("local", relative_path, stat.st_mtime_ns, stat.st_size)
+            if cache_key in saved_index:
+                index[cache_key] = saved_index[cache_key]
+                continue
+
+            try:
+                index[cache_key] = self._parse_local_file(entry.path, stat.st_size)
+            except (OSError, yaml.YAMLError):
+                # Leave the error to be raised when the prompt is loaded
+                continue
+
+        if index.keys() != saved_index.keys():
+            self._save_prompt_index(index_path, index)
+
+        self._prompt_index = index
+
+    @staticmethod
+    def _save_prompt_index(index_path: Path, index: Dict[Tuple[Any, ...], Any]) -> None:
+        """
+        Save the prompt index file.
+
+        The index is written to a temporary file first, so it is never left half
+        written. Prompts can still be loaded without it, so failing to save it is not
+        fatal, and the temporary file is removed again.
+
+        Args:
+            index_path: Path of the prompt index file
+            index: Parsed local prompts, keyed like the prompt cache
+        """
+        temp_path = None
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=index_path.parent, delete=False) as f:
+                temp_path = f.name
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, index_path)
+        except Exception:
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
 
     def _load_gcs_prompt(self, keys: List[str], version: str) -> Dict[str, Any]:
         """
         Load prompt from GCS versioned folder.
 
+        The returned dictionary may be shared with the prompt cache, so it must not be
+        modified.
+
         Args:
             keys: List of keys identifying the prompt
             version: Version number to load from GCS
@@ -150,19 +473,195 @@ class VersionManager(ABC):
             ValueError: If GCS configuration is not properly set up
             FileNotFoundError: If the prompt file is not found in the specified GCS version
         """
-        gcs_client = self._get_gcs_client()
+        bucket = self._get_gcs_bucket()
 
         file_path = self.get_prompt_file_path(keys)
-        gcs_file_path = f"{self.gcs_dir_path}/Version {version}/{file_path}"
 
-        bucket = gcs_client.bucket(self.gcs_bucket_name)
-        blob = bucket.blob(gcs_file_path)
+        cache_key = (version, file_path)
+        prompt_data = self._get_cached_prompt(cache_key)
+        if prompt_data is not None:
+            return prompt_data
+
+        # Only build the blob path when the prompt has to be fetched
+        gcs_file_path = self._get_version_prefix(version) + file_path
+        prompt_data = self._fetch_gcs_prompt(bucket, gcs_file_path, version, file_path)
+
+        self._cache_prompt(cache_key, prompt_data)
+        return prompt_data
 
-        if not blob.exists():
+    def _get_cached_prompt(
+        self, cache_key: Tuple[Any, ...]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached parsed prompt.
+
+        Args:
+            cache_key: Key the prompt was cached under
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached prompt, or None if not cached
+        """
+        try:
+            prompt_data = self._prompt_cache[cache_key]
+            self._prompt_cache.move_to_end(cache_key)
+        except KeyError:
+            return None
+
+        return prompt_data
+
+    def _cache_prompt(self, cache_key: Tuple[Any, ...], prompt_data: Any) -> None:
+        """
+        Cache a parsed prompt, evicting the least recently used one if full.
+
+        Args:
+            cache_key: Key to cache the prompt under
+            prompt_data: Parsed prompt to cache
+        """
+        if self.prompt_cache_size <= 0 or prompt_data is None:
+            return
+
+        self._prompt_cache[cache_key] = prompt_data
+        while len(self._prompt_cache) > self.prompt_cache_size:
+            self._prompt_cache.popitem(last=False)
+
+    def _fetch_gcs_prompt(
+        self, bucket: "storage.Bucket", gcs_file_path: str, version: str, file_path: str
+    ) -> Dict[str, Any]:
+        """
+        Download and parse a prompt file from a GCS version folder.
+
+        Args:
+            bucket: Bucket holding the versioned prompts
+            gcs_file_path: Full blob name of the prompt file
+            version: Version number the file belongs to
+            file_path: Path of the prompt file relative to the version folder
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the parsed YAML content
+
+        Raises:
+            FileNotFoundError: If the prompt file is not found in the specified GCS version
+        """
+        from google.api_core.exceptions import NotFound
+
+        if version not in self._bundled_versions:
+            # Download without checking that the blob exists first, which would cost
+            # an extra request, as a missing blob raises NotFound anyway
+            try:
+                content = bucket.blob(gcs_file_path).download_as_bytes()
+            except NotFound:
+                content = None
+
+            if content is not None:
+                # The parser decodes the raw bytes itself, so skip decoding them to a
+                # string
+                return yaml.load(content, Loader=YAML_LOADER)
+
+        # Fall back to the archive of a bundled snapshot
+        return self._fetch_bundled_prompt(bucket, gcs_file_path, version, file_path)
+
+    def _fetch_bundled_prompt(
+        self, bucket: "storage.Bucket", gcs_file_path: str, version: str, file_path: str
+    ) -> Dict[str, Any]:
+        """
+        Download the archive of a bundled snapshot and parse a prompt file from it.
+
+        The other prompts in the archive are parsed into the prompt cache as well, so
+        that the archive is only downloaded once for all of them.
+
+        Args:
+            bucket: Bucket holding the versioned prompts
+            gcs_file_path: Full blob name the prompt file would have if not bundled
+            version: Version number the file belongs to
+            file_path: Path of the prompt file relative to the version folder
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the parsed YAML content
+
+        Raises:
+            FileNotFoundError: If the version is not bundled or the prompt file is not
+                               in its archive
+        """
+        from google.api_core.exceptions import NotFound
+
+        with self._bundle_lock:
+            bundled_files = self._bundled_versions.get(version)
+            if bundled_files is not None and file_path not in bundled_files:
+                raise FileNotFoundError(
+                    f"Prompt file not found in GCS: {gcs_file_path}"
+                )
+
+            # Another thread may have cached the prompt while this one was waiting
+            prompt_data = self._get_cached_prompt((version, file_path))
+            if prompt_data is not None:
+                return prompt_data
+
+            bundle_blob = bucket.blob(
+                self._get_version_prefix(version) + SNAPSHOT_BUNDLE_NAME
+            )
+            try:
+                bundle = bundle_blob.download_as_bytes()
+            except NotFound:
+                raise FileNotFoundError(
+                    f"Prompt file not found in GCS: {gcs_file_path}"
+                ) from None
+            bundled_files = set()
+
+            found = False
+            with tarfile.open(fileobj=io.BytesIO(bundle), mode="r:gz") as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    bundled_files.add(member.name)
+                    member_content = tar.extractfile(member).read()
+                    if member.name == file_path:
+                        found = True
+                        prompt_data = yaml.load(member_content, Loader=YAML_LOADER)
+                        continue
+
+                    cache_key = (version, member.name)
+                    if self.prompt_cache_size <= 0 or cache_key in self._prompt_cache:
+                        continue
+                    try:
+                        member_data = yaml.load(member_content, Loader=YAML_LOADER)
+                    except yaml.YAMLError:
+                        # Leave the error to be raised when the prompt is loaded
+                        continue
+                    self._cache_prompt(cache_key, member_data)
+
+            self._bundled_versions[version] = bundled_files
+
+        if not found:
             raise FileNotFoundError(f"Prompt file not found in GCS: {gcs_file_path}")
+        return prompt_data
+
+    def _list_version_folders(self) -> List[str]:
+        """
+        List the names of the version folders in GCS, without validating them.
+
+        Only the folders one level below gcs_dir_path are listed rather than every
+        blob inside them, so the cost grows with the number of versions, not files.
+
+        Returns:
+            List[str]: Folder names after "Version " (e.g., "1.0.0"), in no order
+
+        Raises:
+            ValueError: If GCS configuration is not properly set up
+        """
+        bucket = self._get_gcs_bucket()
+
+        prefix = f"{self.gcs_dir_path}/Version " if self.gcs_dir_path else "Version "
+        # Only request the folder prefixes, not the metadata of any blobs
+        blobs = bucket.list_blobs(
+            prefix=prefix, delimiter="/", fields="prefixes,nextPageToken"
+        )
+
+        # The folder prefixes are only known once every page has been fetched
+        for _ in blobs:
+            pass
 
-        content = blob.download_as_text(encoding="utf-8")
-        return yaml.safe_load(content)
+        # Prefixes look like "tmp/prompt-artifacts/Version 1.0.0/"
+        return [folder[len(prefix) : -1] for folder in blobs.prefixes]
 
     def _get_next_version(self, bump_type: Literal["major", "minor", "patch"]) -> str:
         """
@@ -177,29 +676,11 @@ class VersionManager(ABC):
         Raises:
             ValueError: If GCS configuration is not properly set up
         """
-        gcs_client = self._get_gcs_client()
-
-        bucket = gcs_client.bucket(self.gcs_bucket_name)
-
-        # List all version folders by parsing from actual file paths
-        prefix = f"{self.gcs_dir_path}/Version " if self.gcs_dir_path else "Version "
-        blobs = bucket.list_blobs(prefix=prefix)
+        # Always list the versions afresh, so that a version created since the cached
+        # listing is not created again. This also refreshes the cached listing.
+        versions = self._refresh_versions()
 
-        existing_versions = set()  # Use set to avoid duplicates
-        for blob in blobs:
-            # Extract version from blob path like "tmp/prompt-artifacts/Version 1.0.0/file.yaml"
-            blob_path = blob.name
-            if blob_path.startswith(prefix):
-                # Find the version part after "Version "
-                remaining_path = blob_path[len(prefix) :]
-                # Get the version directory (first part before next slash)
-                version_part = remaining_path.split("/")[0]
-                try:
-                    existing_versions.add(version.parse(version_part))
-                except version.InvalidVersion:
-                    continue
-
-        if not existing_versions:
+        if not versions:
             # No existing versions, start with 1.0.0
             if bump_type == "major":
                 return "1.0.0"
@@ -208,22 +689,14 @@ class VersionManager(ABC):
             else:  # patch
                 return "0.0.1"
 
-        # Get the latest version
-        latest_version = max(existing_versions)
-
-        # Calculate next version based on bump type
+        # Calculate next version based on bump type, from the latest version
+        major, minor, patch = map(int, versions[0].split("."))
         if bump_type == "major":
-            next_version = version.Version(f"{latest_version.major + 1}.0.0")
+            return f"{major + 1}.0.0"
         elif bump_type == "minor":
-            next_version = version.Version(
-                f"{latest_version.major}.{latest_version.minor + 1}.0"
-            )
+            return f"{major}.{minor + 1}.0"
         else:  # patch
-            next_version = version.Version(
-                f"{latest_version.major}.{latest_version.minor}.{latest_version.micro + 1}"
-            )
-
-        return str(next_version)
+            return f"{major}.{minor}.{patch + 1}"
 
     def _upload_dir_to_gcs(self, version: str) -> None:
         """
@@ -235,45 +708,287 @@ class VersionManager(ABC):
         Raises:
             ValueError: If GCS configuration is not properly set up
         """
-        gcs_client = self._get_gcs_client()
+        bucket = self._get_gcs_bucket()
+        version_prefix = self._get_version_prefix(version)
+
+        # Index the files of the latest existing version, so that files that have not
+        # changed since then can be copied within GCS instead of uploaded again
+        previous_blobs = {}
+        previous_version = next((v for v in self.list_versions() if v != version), None)
+        if previous_version is not None:
+            previous_prefix = self._get_version_prefix(previous_version)
+            for blob in self._list_version_blobs(previous_version):
+                previous_blobs[blob.name[len(previous_prefix) :]] = blob
+
+        tasks = []
+        for entry, relative_path in self._iter_local_files():
+            # Create GCS blob path
+            gcs_blob_path = version_prefix + relative_path
+
+            tasks.append(
+                partial(
+                    self._upload_file,
+                    entry.path,
+                    entry.stat().st_size,
+                    bucket.blob(gcs_blob_path),
+                    previous_blobs.get(relative_path),
+                )
+            )
+
+        # Upload the files concurrently, since each upload of a small prompt file is
+        # dominated by the request round trip rather than bandwidth
+        self._run_concurrently(tasks)
+
+    def _run_concurrently(self, tasks: List[Callable[[], Any]]) -> None:
+        """
+        Run GCS transfer tasks on a thread pool of up to max_workers threads.
+
+        Args:
+            tasks: Functions to call, each performing one transfer
+
+        Raises:
+            Exception: The first error raised by a task, after cancelling the tasks
+                       that have not started yet
+        """
+        if not tasks:
+            return
+
+        max_workers = max(1, min(self.max_workers, len(tasks)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _upload_bundle_to_gcs(self, version: str) -> None:
+        """
+        Upload the entire local prompts directory to GCS as a single tar.gz blob.
 
-        bucket = gcs_client.bucket(self.gcs_bucket_name)
+        Args:
+            version: Version number to use for the GCS folder name
+
+        Raises:
+            ValueError: If GCS configuration is not properly set up
+        """
+        bucket = self._get_gcs_bucket()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bundle_path = Path(temp_dir) / SNAPSHOT_BUNDLE_NAME
+            with tarfile.open(bundle_path, "w:gz") as tar:
+                files = sorted(self._iter_local_files(), key=lambda file: file[1])
+                for entry, relative_path in files:
+                    tar.add(entry.path, arcname=relative_path)
 
-        for file_path in self.local_dir_path.rglob("*"):
-            if file_path.is_file():
-                # Skip ignored files
-                if self._should_ignore_file(file_path):
-                    continue
+            # Upload the archive
+            gcs_blob_path = self._get_version_prefix(version) + SNAPSHOT_BUNDLE_NAME
+            blob = bucket.blob(gcs_blob_path)
+            blob.upload_from_filename(str(bundle_path))
 
-                # Calculate relative path from prompts directory
-                relative_path = file_path.relative_to(self.local_dir_path)
+    def _extract_bundle(self, bundle_blob: "storage.Blob", target_dir: Path) -> None:
+        """
+        Download the archive of a bundled snapshot and extract it to a local directory.
 
-                # Create GCS blob path
-                gcs_blob_path = f"{self.gcs_dir_path}/Version {version}/{relative_path}"
+        Args:
+            bundle_blob: Blob of the snapshot archive
+            target_dir: Local directory path where files should be extracted
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bundle_path = Path(temp_dir) / SNAPSHOT_BUNDLE_NAME
+            self._download_blob(bundle_blob, bundle_path)
+
+            with tarfile.open(bundle_path, "r:gz") as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+
+                    # Never write outside of the target directory
+                    relative_path = PurePosixPath(member.name)
+                    if relative_path.is_absolute() or ".." in relative_path.parts:
+                        continue
+
+                    # Skip ignored files
+                    if self._should_ignore_gcs_path(member.name):
+                        continue
+
+                    source = tar.extractfile(member)
+                    if source is None:
+                        continue
+
+                    target_file_path = target_dir / relative_path
+                    target_file_path.parent.mkdir(parents=True, exist_ok=True)
+                    with source, open(target_file_path, "wb") as target:
+                        shutil.copyfileobj(source, target)
+
+    def _upload_file(
+        self,
+        file_path: str,
+        file_size: int,
+        blob: "storage.Blob",
+        previous_blob: Optional["storage.Blob"] = None,
+    ) -> None:
+        """
+        Upload a single local file to a blob.
+
+        If the file has the same content as the blob of a previous version, that blob
+        is copied within GCS instead, so that no file content is transferred. Large
+        files are split into parts that are uploaded concurrently, since a single
+        stream is too slow for them.
+
+        Args:
+            file_path: Local file path to upload
+            file_size: Size of the file in bytes
+            blob: Blob to upload the file to
+            previous_blob: Blob of the same file in a previous version, as returned
+                           by a listing (so its size and checksum are known)
+        """
+        if (
+            previous_blob is not None
+            and previous_blob.size == file_size
+            and self._matches_crc32c(previous_blob, Path(file_path))
+        ):
+            from google.cloud.storage.retry import DEFAULT_RETRY
+
+            # Copies are only retried by default when they have preconditions, but
+            # copying the same source generation again always gives the same result
+            previous_blob.bucket.copy_blob(
+                previous_blob,
+                blob.bucket,
+                blob.name,
+                source_generation=previous_blob.generation,
+                retry=DEFAULT_RETRY,
+            )
+        elif file_size > LARGE_BLOB_SIZE:
+            from google.cloud.storage import transfer_manager
+
+            transfer_manager.upload_chunks_concurrently(
+                file_path,
+                blob,
+                chunk_size=UPLOAD_CHUNK_SIZE,
+                worker_type=transfer_manager.THREAD,
+                max_workers=self.max_workers,
+            )
+        else:
+            blob.upload_from_filename(file_path)
+
+    def _download_blob(self, blob: "storage.Blob", target_file_path: Path) -> None:
+        """
+        Download a single blob to a local file.
+
+        Large blobs are split into chunks that are downloaded concurrently, since a
+        single stream is too slow for them.
+
+        Args:
+            blob: Blob to download, as returned by a listing (so its size is known)
+            target_file_path: Local file path to download the blob to
+        """
+        if blob.size is not None and blob.size > LARGE_BLOB_SIZE:
+            from google.cloud.storage import transfer_manager
+
+            transfer_manager.download_chunks_concurrently(
+                blob,
+                str(target_file_path),
+                chunk_size=DOWNLOAD_CHUNK_SIZE,
+                worker_type=transfer_manager.THREAD,
+                max_workers=self.max_workers,
+            )
+        else:
+            blob.download_to_filename(str(target_file_path))
+
+    def _remove_files_not_in(self, target_dir: Path, keep_paths: set) -> None:
+        """
+        Remove the files in a local directory that are not in a set of paths to keep.
+
+        Args:
+            target_dir: Local directory to clean up
+            keep_paths: Paths of the files to keep within target_dir
+        """
+        for file_path in list(target_dir.rglob("*")):
+            if not file_path.is_dir() and file_path not in keep_paths:
+                file_path.unlink()
+
+        # Remove the directories that were left empty, deepest first
+        for dir_path in sorted(target_dir.rglob("*"), reverse=True):
+            if dir_path.is_dir() and not any(dir_path.iterdir()):
+                dir_path.rmdir()
+
+    def _matches_crc32c(self, blob: "storage.Blob", file_path: Path) -> bool:
+        """
+        Check if a local file has the same content as a blob, using its CRC32C checksum.
+
+        Args:
+            blob: Blob to compare against, as returned by a listing
+            file_path: Local file path to compare
+
+        Returns:
+            bool: True if the local file exists and matches the checksum of the blob
+        """
+        if not blob.crc32c or not file_path.is_file():
+            return False
+
+        checksum = google_crc32c.Checksum()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                checksum.update(chunk)
+
+        return checksum.digest() == base64.b64decode(blob.crc32c)
+
+    def _list_version_blobs(self, version: str) -> List["storage.Blob"]:
+        """
+        List all blobs of a specific version folder in GCS.
+
+        Only the metadata needed to download the blobs and compare them to local
+        files is requested.
+
+        Args:
+            version: Version number to list
+
+        Returns:
+            List[storage.Blob]: Blobs with the version prefix
+
+        Raises:
+            ValueError: If GCS configuration is not properly set up
+        """
+        bucket = self._get_gcs_bucket()
+        version_prefix = self._get_version_prefix(version)
 
-                # Upload file
-                blob = bucket.blob(gcs_blob_path)
-                blob.upload_from_filename(str(file_path))
+        return list(
+            bucket.list_blobs(
+                prefix=version_prefix,
+                fields="items(name,size,crc32c,generation),nextPageToken",
+            )
+        )
 
-    def _download_gcs_to_dir(self, version: str, target_dir: Path) -> None:
+    def _download_gcs_to_dir(
+        self,
+        version: str,
+        target_dir: Path,
+        sync: bool = False,
+        blobs: Optional[List["storage.Blob"]] = None,
+    ) -> None:
         """
         Download a specific version folder from GCS to a local directory.
 
         Args:
             version: Version number to download from GCS
             target_dir: Local directory path where files should be downloaded
+            sync: If True, make target_dir an exact copy of the version in place:
+                  files that already match are not downloaded again, and files that
+                  are not part of the version are removed
+            blobs: Blobs of the version folder, if they have already been listed
 
         Raises:
             ValueError: If GCS configuration is not properly set up
         """
-        gcs_client = self._get_gcs_client()
-
-        bucket = gcs_client.bucket(self.gcs_bucket_name)
-        version_prefix = f"{self.gcs_dir_path}/Version {version}/"
-
-        # List all blobs with the version prefix
-        blobs = bucket.list_blobs(prefix=version_prefix)
+        version_prefix = self._get_version_prefix(version)
+        if blobs is None:
+            blobs = self._list_version_blobs(version)
 
+        downloads = []
+        bundle_blob = None
         for blob in blobs:
             # Skip if it's just a directory marker
             if blob.name.endswith("/"):
@@ -282,6 +997,11 @@ class VersionManager(ABC):
             # Calculate the relative path within the version folder
             relative_path = blob.name[len(version_prefix) :]
 
+            # Extract the archive of a bundled snapshot separately
+            if relative_path == SNAPSHOT_BUNDLE_NAME:
+                bundle_blob = blob
+                continue
+
             # Skip ignored files
             if self._should_ignore_gcs_path(relative_path):
                 continue
@@ -289,11 +1009,45 @@ class VersionManager(ABC):
             # Create the target file path
             target_file_path = target_dir / relative_path
 
-            # Create parent directories if they don't exist
-            target_file_path.parent.mkdir(parents=True, exist_ok=True)
+            downloads.append((blob, target_file_path))
 
-            # Download the file
-            blob.download_to_filename(str(target_file_path))
+        if sync:
+            if bundle_blob is not None:
+                # The archive can't be compared file by file, so extract it into an
+                # emptied directory instead
+                shutil.rmtree(target_dir)
+                target_dir.mkdir(parents=True)
+            else:
+                self._remove_files_not_in(
+                    target_dir, {target_file_path for _, target_file_path in downloads}
+                )
+                downloads = [
+                    (blob, target_file_path)
+                    for blob, target_file_path in downloads
+                    if not self._matches_crc32c(blob, target_file_path)
+                ]
+
+        if bundle_blob is not None:
+            self._extract_bundle(bundle_blob, target_dir)
+
+        if not downloads:
+            return
+
+        # Create parent directories if they don't exist
+        created_dirs = set()
+        for _, target_file_path in downloads:
+            if target_file_path.parent not in created_dirs:
+                target_file_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(target_file_path.parent)
+
+        # Download the files concurrently, since prompt files are small and each
+        # download is dominated by the request round trip rather than bandwidth
+        self._run_concurrently(
+            [
+                partial(self._download_blob, blob, target_file_path)
+                for blob, target_file_path in downloads
+            ]
+        )
 
     @abstractmethod
     def get_prompt_file_path(self, keys: List[str]) -> str:
@@ -323,30 +1077,54 @@ class VersionManager(ABC):
         Raises:
             ValueError: If GCS is not configured
         """
-        gcs_client = self._get_gcs_client()
+        # Check the configuration even when a cached listing is available
+        self._get_gcs_bucket()
 
-        bucket = gcs_client.bucket(self.gcs_bucket_name)
-        prefix = f"{self.gcs_dir_path}/Version " if self.gcs_dir_path else "Version "
+        # Reuse a recent listing, since each listing is a round trip to GCS
+        if self._versions_cache is not None:
+            listed_at, cached_versions = self._versions_cache
+            if time.monotonic() - listed_at < self.versions_cache_ttl:
+                return list(cached_versions)
 
-        versions = set()  # Use set to avoid duplicates
-        for blob in bucket.list_blobs(prefix=prefix):
-            # Extract version from blob path like "tmp/prompt-artifacts/Version 1.0.0/file.yaml"
-            blob_path = blob.name
-            if blob_path.startswith(prefix):
-                # Find the version part after "Version "
-                remaining_path = blob_path[len(prefix) :]
-                # Get the version directory (first part before next slash)
-                version_part = remaining_path.split("/")[0]
-                try:
-                    version.parse(version_part)  # Validate version format
-                    versions.add(version_part)
-                except version.InvalidVersion:
-                    continue
+        return self._refresh_versions()
+
+    def _refresh_versions(self) -> List[str]:
+        """
+        List all available versions in GCS without the cache, and cache the result.
+
+        Returns:
+            List[str]: List of version numbers sorted in descending order (most recent first)
+
+        Raises:
+            ValueError: If GCS is not configured
+        """
+        # Parse each valid version once, keyed by its (major, minor, patch) numbers
+        parsed_versions = {}
+        for version_part in self._list_version_folders():
+            match = VERSION_PATTERN.fullmatch(version_part)
+            if match:
+                parsed_versions[version_part] = tuple(map(int, match.groups()))
+
+        # Sort versions in descending order
+        versions_list = sorted(
+            parsed_versions, key=parsed_versions.__getitem__, reverse=True
+        )
 
-        # Convert to list and sort versions in descending order
-        versions_list = list(versions)
-        versions_list.sort(key=lambda v: version.parse(v), reverse=True)
-        return versions_list
+        self._versions_cache = (time.monotonic(), versions_list)
+        return list(versions_list)
+
+    def clear_cache(self) -> None:
+        """
+        Forget the cached prompts and version listing, so they are read again.
+
+        Local prompts are already reloaded when their files change, so this is only
+        needed to pick up changes made to GCS by other processes.
+        """
+        self._prompt_cache.clear()
+        self._formatted_prompt_cache.clear()
+        self._prompt_index.clear()
+        self._prompt_index_loaded = False
+        self._versions_cache = None
 
     def load_prompt(self, keys: List[str], version: str = "local") -> Dict[str, Any]:
         """
@@ -359,6 +1137,66 @@ class VersionManager(ABC):
         Returns:
             Dict[str, Any]: Dictionary containing the parsed YAML content
 
+        Raises:
+            FileNotFoundError: If the prompt file is not found
+            ValueError: If version is not "local" but GCS is not configured, or if no versions exist when using "latest"
+        """
+        prompt_data = self._load_prompt_data(keys, version)
+
+        # Copy so that callers cannot modify the cached prompt
+        if self.prompt_cache_size > 0:
+            return copy.deepcopy(prompt_data)
+        return prompt_data
+
+    def load_prompts(
+        self, keys_list: List[List[str]], version: str = "local"
+    ) -> List[Dict[str, Any]]:
+        """
+        Load several prompts from either local directory or a specific version in GCS.
+
+        Prompts from GCS are downloaded concurrently, since each download is
+        dominated by the request round trip.
+
+        Args:
+            keys_list: List of the keys identifying each prompt
+            version: Version to load ("local" for local directory, "latest" for most recent GCS version, or specific version number like "1.0.0")
+
+        Returns:
+            List[Dict[str, Any]]: Parsed YAML content of each prompt, in the order of keys_list
+
+        Raises:
+            FileNotFoundError: If a prompt file is not found
+            ValueError: If version is not "local" but GCS is not configured, or if no versions exist when using "latest"
+        """
+        if version == "local" or len(keys_list) <= 1:
+            return [self.load_prompt(keys, version) for keys in keys_list]
+
+        # Resolve the latest version once for the whole batch
+        if version == "latest":
+            versions = self.list_versions()
+            if not versions:
+                raise ValueError("No versions found in GCS")
+            version = versions[0]  # list_versions returns sorted in descending order
+
+        max_workers = max(1, min(self.max_workers, len(keys_list)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.load_prompt, keys, version) for keys in keys_list
+            ]
+            return [future.result() for future in futures]
+
+    def _load_prompt_data(self, keys: List[str], version: str) -> Dict[str, Any]:
+        """
+        Load a prompt like load_prompt, but without copying it out of the cache.
+
+        Args:
+            keys: List of keys identifying the prompt
+            version: Version to load ("local", "latest" or a specific version number)
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the parsed YAML content, which must
+                            not be modified
+
         Raises:
             FileNotFoundError: If the prompt file is not found
             ValueError: If version is not "local" but GCS is not configured, or if no versions exist when using "latest"
@@ -389,22 +1227,58 @@ class VersionManager(ABC):
             field: Optional field to extract from the YAML (e.g., "extraction_instructions")
 
         Returns:
-            str: String representation of the prompt or specific field
+            str: The prompt or specific field, with nested content formatted as YAML
 
         Raises:
             FileNotFoundError: If the prompt file is not found
             ValueError: If version is not "local" but GCS is not configured, or if no versions exist when using "latest"
             KeyError: If the specified field is not found in the prompt
         """
-        prompt_data = self.load_prompt(keys, version)
+        # The prompt is only read here, so it doesn't need to be copied out of the cache
+        prompt_data = self._load_prompt_data(keys, version)
 
         if field:
             if field not in prompt_data:
                 raise KeyError(f"Field '{field}' not found in prompt")
-            return str(prompt_data[field])
+            field_data = prompt_data[field]
+            if isinstance(field_data, (dict, list)):
+                # Format nested sections as YAML like the full prompt, rather than as
+                # a Python repr
+                return self._format_yaml(field_data)
+            return str(field_data)
+
+        # Return the entire prompt as a formatted string, which is only formatted
+        # once for as long as the parsed prompt stays cached
+        cached = self._formatted_prompt_cache.get(id(prompt_data))
+        if cached is not None and cached[0] is prompt_data:
+            self._formatted_prompt_cache.move_to_end(id(prompt_data))
+            return cached[1]
+
+        prompt_str = self._format_yaml(prompt_data)
+
+        if self.prompt_cache_size > 0:
+            self._formatted_prompt_cache[id(prompt_data)] = (prompt_data, prompt_str)
+            while len(self._formatted_prompt_cache) > self.prompt_cache_size:
+                self._formatted_prompt_cache.popitem(last=False)
+        return prompt_str
+
+    @staticmethod
+    def _format_yaml(data: Any) -> str:
+        """
+        Format parsed YAML content as a block-style YAML string.
+
+        Args:
+            data: Parsed YAML content to format
 
-        # Return the entire prompt as a formatted string
-        return yaml.dump(prompt_data, default_flow_style=False, allow_unicode=True)
+        Returns:
+            str: The YAML string
+        """
+        return yaml.dump(
+            data,
+            Dumper=YAML_DUMPER,
+            default_flow_style=False,
+            allow_unicode=True,
+        )
 
     def save_snapshot(
         self, next_version_bump: Literal["major", "minor", "patch"] = "major"
@@ -425,7 +1299,13 @@ class VersionManager(ABC):
         next_version = self._get_next_version(next_version_bump)
 
         # Upload all files from local prompts directory
-        self._upload_dir_to_gcs(next_version)
+        if self.bundle_snapshots:
+            self._upload_bundle_to_gcs(next_version)
+        else:
+            self._upload_dir_to_gcs(next_version)
+
+        # The cached version listing no longer includes the new version
+        self._versions_cache = None
 
         return next_version
 
@@ -451,7 +1331,8 @@ class VersionManager(ABC):
             FileNotFoundError: If the specified version doesn't exist in GCS
             FileExistsError: If target directory already exists when replace=False
         """
-        gcs_client = self._get_gcs_client()
+        # Fail early if GCS is not configured
+        self._get_gcs_bucket()
 
         if not replace and target_dir is None:
             raise ValueError("target_dir must be provided when replace=False")
@@ -463,21 +1344,17 @@ class VersionManager(ABC):
                 raise ValueError("No versions found in GCS")
             version = versions[0]  # list_versions returns sorted in descending order
 
-        # Validate that the version exists
-        bucket = gcs_client.bucket(self.gcs_bucket_name)
-        version_prefix = f"{self.gcs_dir_path}/Version {version}/"
-
-        # Check if any blobs exist with this version prefix
-        blobs = list(bucket.list_blobs(prefix=version_prefix, max_results=1))
+        # Validate that the version exists. The listing is reused for the download,
+        # so that the version folder is only listed once
+        blobs = self._list_version_blobs(version)
         if not blobs:
             raise FileNotFoundError(f"Version {version} not found in GCS")
 
         # Determine target directory
         if replace:
-            # Use configured local directory and replace it
+            # Use configured local directory and sync it in place, so that files
+            # that are already up to date are not downloaded again
             final_target_dir = self.local_dir_path
-            if final_target_dir.exists():
-                shutil.rmtree(final_target_dir)
         else:
             # Use provided target directory
             final_target_dir = Path(target_dir)  # pyrefly: ignore
@@ -490,6 +1367,9 @@ class VersionManager(ABC):
         final_target_dir.mkdir(parents=True, exist_ok=True)
 
         # Download the version folder
-        self._download_gcs_to_dir(version, final_target_dir)
+        if replace:
+            self._download_gcs_to_dir(version, final_target_dir, sync=True, blobs=blobs)
+        else:
+            self._download_gcs_to_dir(version, final_target_dir, blobs=blobs)
 
         return str(final_target_dir)
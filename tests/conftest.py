@@ -1,13 +1,27 @@
 """Pytest configuration and fixtures for VersionManager tests."""
 
+import copy
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock
 
 import pytest
 import yaml
 
-from prompt2blob_vm.version_manager import VersionManager
+from prompt2blob_vm.version_manager import (
+    YAML_DUMPER,
+    VersionManager,
+    _get_shared_gcs_client,
+)
+
+SAMPLE_YAML_CONTENT = {
+    "test_metric": {
+        "description": "Sample test prompt",
+        "synonyms": ["test", "sample"],
+        "extraction_instructions": "Extract test information",
+    }
+}
 
 
 class ConcreteVersionManager(VersionManager):
@@ -26,6 +40,66 @@ class ConcreteVersionManager(VersionManager):
         return "/".join(keys) + ".yaml"
 
 
+class BlobListing:
+    """Result of a mocked delimited list_blobs call, with the folder prefixes."""
+
+    def __init__(self, blobs, prefixes):
+        self._blobs = blobs
+        self.prefixes = prefixes
+
+    def __iter__(self):
+        return iter(self._blobs)
+
+
+def mock_list_blobs_with_delimiter(bucket):
+    """
+    Make delimited list_blobs calls on a mock bucket behave like GCS.
+
+    Tests set bucket.list_blobs.return_value to the blobs in the bucket. Calls with
+    a delimiter then list the folder prefixes derived from those blob names, while
+    calls without one keep returning the blobs as they are.
+    """
+
+    def list_blobs(prefix="", delimiter=None, **kwargs):
+        if delimiter is None:
+            return DEFAULT
+
+        blobs = []
+        prefixes = set()
+        for blob in bucket.list_blobs.return_value:
+            if not blob.name.startswith(prefix):
+                continue
+            remaining_path = blob.name[len(prefix) :]
+            if delimiter in remaining_path:
+                folder = remaining_path[: remaining_path.index(delimiter) + 1]
+                prefixes.add(prefix + folder)
+            else:
+                blobs.append(blob)
+        return BlobListing(blobs, prefixes)
+
+    bucket.list_blobs.side_effect = list_blobs
+
+
+def mock_version_blobs(versions, file_name="test.yaml"):
+    """
+    Create lightweight blobs with one file in each of the given versions.
+
+    Only the blob names are set, which is all that listing versions looks at.
+    """
+    return [
+        SimpleNamespace(name=f"test-prompts/Version {version}/{file_name}")
+        for version in versions
+    ]
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_gcs_clients():
+    """Forget the GCS clients shared between managers, so each test creates its own."""
+    _get_shared_gcs_client.cache_clear()
+    yield
+    _get_shared_gcs_client.cache_clear()
+
+
 @pytest.fixture
 def temp_prompts_dir():
     """Create a temporary directory with sample prompt files."""
@@ -62,7 +136,13 @@ def temp_prompts_dir():
             full_path = prompts_dir / file_path
             full_path.parent.mkdir(parents=True, exist_ok=True)
             with open(full_path, "w", encoding="utf-8") as f:
-                yaml.dump(content, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(
+                    content,
+                    f,
+                    Dumper=YAML_DUMPER,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                )
 
         yield str(prompts_dir)
 
@@ -78,16 +158,16 @@ def mock_gcs_client():
     blob = Mock()
     bucket.blob.return_value = blob
     bucket.list_blobs.return_value = []
+    mock_list_blobs_with_delimiter(bucket)
 
-    blob.exists.return_value = True
-    blob.download_as_text.return_value = yaml.dump(
+    blob.download_as_bytes.return_value = yaml.dump(
         {
             "test_metric": {
                 "description": "Test prompt from GCS",
                 "extraction_instructions": "Test instructions",
             }
         }
-    )
+    ).encode("utf-8")
 
     return client
 
@@ -106,6 +186,7 @@ def version_manager_gcs(temp_prompts_dir, mock_gcs_client):
         gcs_bucket_name="test-bucket",
         gcs_dir_path="test-prompts",
     )
+    # The client is created lazily, so the mock is in place before any real one is
     manager._gcs_client = mock_gcs_client
     return manager
 
@@ -113,10 +194,11 @@ def version_manager_gcs(temp_prompts_dir, mock_gcs_client):
 @pytest.fixture
 def sample_yaml_content():
     """Sample YAML content for testing."""
-    return {
-        "test_metric": {
-            "description": "Sample test prompt",
-            "synonyms": ["test", "sample"],
-            "extraction_instructions": "Extract test information",
-        }
-    }
+    return copy.deepcopy(SAMPLE_YAML_CONTENT)
+
+
+@pytest.fixture(scope="session")
+def sample_yaml_bytes():
+    """Sample YAML content serialized as a GCS blob would return it."""
+    # Dumped once for the whole session, instead of in every test that mocks a blob
+    return yaml.dump(SAMPLE_YAML_CONTENT, Dumper=YAML_DUMPER).encode("utf-8")
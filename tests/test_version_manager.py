@@ -1,15 +1,24 @@
 """Unit tests for VersionManager class."""
 
-import tempfile
+import base64
+import io
+import os
+import pickle
+import tarfile
+import threading
+import tracemalloc
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import google_crc32c
 import pytest
 import yaml
+from google.api_core.exceptions import NotFound
+from google.cloud.storage.retry import DEFAULT_RETRY
 
-from prompt2blob_vm.version_manager import VersionManager
+from prompt2blob_vm.version_manager import YAML_LOADER, VersionManager
 
-from .conftest import ConcreteVersionManager
+from .conftest import ConcreteVersionManager, mock_version_blobs
 
 
 class TestVersionManagerInit:
@@ -26,7 +35,7 @@ class TestVersionManagerInit:
 
     def test_init_with_gcs_config(self):
         """Test initialization with GCS configuration."""
-        with patch("prompt2blob_vm.version_manager.storage.Client") as mock_client:
+        with patch("google.cloud.storage.Client") as mock_client:
             manager = ConcreteVersionManager(
                 local_dir_path="test_prompts",
                 gcs_bucket_name="test-bucket",
@@ -37,19 +46,37 @@ class TestVersionManagerInit:
             assert str(manager.local_dir_path) == "test_prompts"
             assert manager.gcs_bucket_name == "test-bucket"
             assert manager.gcs_dir_path == "prompts"  # Should strip trailing slash
+
+            # The client is only created when GCS is first used
+            mock_client.from_service_account_json.assert_not_called()
+            manager._get_gcs_client()
             mock_client.from_service_account_json.assert_called_once_with(
                 "credentials.json"
             )
 
     def test_init_with_gcs_no_credentials(self):
         """Test initialization with GCS but no credentials file."""
-        with patch("prompt2blob_vm.version_manager.storage.Client") as mock_client:
+        with patch("google.cloud.storage.Client") as mock_client:
             manager = ConcreteVersionManager(
                 gcs_bucket_name="test-bucket", gcs_dir_path="prompts"
             )
 
+            mock_client.assert_not_called()
+            assert manager._get_gcs_client() is not None
+            mock_client.assert_called_once()
+
+    def test_init_shares_gcs_client(self):
+        """Test that managers with the same credentials share one GCS client."""
+        with patch("google.cloud.storage.Client") as mock_client:
+            manager1 = ConcreteVersionManager(
+                gcs_bucket_name="test-bucket", gcs_dir_path="prompts"
+            )
+            manager2 = ConcreteVersionManager(
+                gcs_bucket_name="other-bucket", gcs_dir_path="prompts"
+            )
+
+            assert manager1._get_gcs_client() is manager2._get_gcs_client()
             mock_client.assert_called_once()
-            assert manager._gcs_client is not None
 
     def test_init_with_ignore_files(self):
         """Test initialization with ignore_files parameter."""
@@ -66,6 +93,12 @@ class TestVersionManagerInit:
 
         assert manager.ignore_files == []
 
+    def test_init_with_max_workers(self):
+        """Test initialization with max_workers parameter."""
+        manager = ConcreteVersionManager(local_dir_path="test_prompts", max_workers=4)
+
+        assert manager.max_workers == 4
+
 
 class TestLocalPromptOperations:
     """Test local prompt loading operations."""
@@ -89,11 +122,186 @@ class TestLocalPromptOperations:
         assert result["metric_1"]["description"] == "This is a brand 1 specific prompt."
         assert "Brand 1 Metric" in result["metric_1"]["synonyms"]
 
+    def test_load_local_prompt_cached(self, version_manager_local):
+        """Test that an unchanged local prompt is only parsed once."""
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            first = version_manager_local.load_prompt(["generic", "metric_1"])
+            first["metric_1"]["description"] = "Modified by the caller"
+            second = version_manager_local.load_prompt(["generic", "metric_1"])
+
+        assert second["metric_1"]["description"] == "This is a generic prompt."
+        assert mock_load.call_count == 1
+
+    def test_load_local_prompt_cache_invalidated_on_edit(self, version_manager_local):
+        """Test that editing a local prompt file bypasses the cached prompt."""
+        version_manager_local.load_prompt(["generic", "metric_1"])
+
+        file_path = version_manager_local.local_dir_path / "generic" / "metric_1.yaml"
+        file_path.write_text("metric_1:\n  description: Edited prompt\n")
+
+        result = version_manager_local.load_prompt(["generic", "metric_1"])
+
+        assert result["metric_1"]["description"] == "Edited prompt"
+
+    def test_load_local_prompt_cache_invalidated_on_touch(self, version_manager_local):
+        """Test that a local prompt is parsed again when only its mtime changes."""
+        file_path = version_manager_local.local_dir_path / "generic" / "metric_1.yaml"
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            version_manager_local.load_prompt(["generic", "metric_1"])
+            stat = file_path.stat()
+            os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            version_manager_local.load_prompt(["generic", "metric_1"])
+
+        assert mock_load.call_count == 2
+
+    def test_load_local_prompt_allocation_budget(self, version_manager_local):
+        """Test that repeatedly loading a cached prompt keeps memory use bounded."""
+        version_manager_local.load_prompt(["generic", "metric_1"])
+
+        tracemalloc.start()
+        try:
+            for _ in range(100):
+                version_manager_local.load_prompt(["generic", "metric_1"])
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Each load only copies one small prompt, which is freed again
+        assert current < 10_000
+        assert peak < 100_000
+
+    def test_load_local_prompt_index(self, temp_prompts_dir):
+        """Test that a restarted manager only parses the files that changed."""
+        index_path = str(Path(temp_prompts_dir).parent / "index" / "prompts.pkl")
+        manager = ConcreteVersionManager(
+            local_dir_path=temp_prompts_dir, prompt_index_path=index_path
+        )
+        manager.load_prompt(["generic", "metric_1"])
+        assert Path(index_path).is_file()
+
+        file_path = Path(temp_prompts_dir) / "customized" / "brand_1" / "metric_1.yaml"
+        file_path.write_text("metric_1:\n  description: Edited prompt\n")
+
+        restarted_manager = ConcreteVersionManager(
+            local_dir_path=temp_prompts_dir, prompt_index_path=index_path
+        )
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            generic = restarted_manager.load_prompt(["generic", "metric_1"])
+            edited = restarted_manager.load_prompt(
+                ["customized", "brand_1", "metric_1"]
+            )
+
+        assert generic["metric_1"]["description"] == "This is a generic prompt."
+        assert edited["metric_1"]["description"] == "Edited prompt"
+        assert mock_load.call_count == 1
+
+    def test_load_local_prompt_index_larger_than_cache(self, tmp_path):
+        """Test that an index with more prompts than the cache holds is all used."""
+        prompts_dir = tmp_path / "prompts"
+        prompts_dir.mkdir()
+        for i in range(10):
+            (prompts_dir / f"metric_{i}.yaml").write_text(f"description: Prompt {i}\n")
+        index_path = str(tmp_path / "index.pkl")
+
+        manager = ConcreteVersionManager(
+            local_dir_path=str(prompts_dir),
+            prompt_index_path=index_path,
+            prompt_cache_size=2,
+        )
+        manager.load_prompt(["metric_0"])
+
+        restarted_manager = ConcreteVersionManager(
+            local_dir_path=str(prompts_dir),
+            prompt_index_path=index_path,
+            prompt_cache_size=2,
+        )
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            for i in range(10):
+                prompt = restarted_manager.load_prompt([f"metric_{i}"])
+                assert prompt["description"] == f"Prompt {i}"
+
+        # The index doesn't go through the prompt cache, so none of it is evicted
+        mock_load.assert_not_called()
+        assert len(restarted_manager._prompt_cache) == 0
+
+    def test_load_local_prompt_index_save_failure(self, temp_prompts_dir, tmp_path):
+        """Test that failing to save the index leaves no temporary file behind."""
+        index_dir = tmp_path / "index"
+        manager = ConcreteVersionManager(
+            local_dir_path=temp_prompts_dir,
+            prompt_index_path=str(index_dir / "prompts.pkl"),
+        )
+
+        with patch("pickle.dump", side_effect=pickle.PicklingError("unpicklable")):
+            prompt = manager.load_prompt(["generic", "metric_1"])
+
+        assert prompt["metric_1"]["description"] == "This is a generic prompt."
+        assert list(index_dir.iterdir()) == []
+
+    def test_load_local_prompt_index_inside_prompts_dir(self, temp_prompts_dir):
+        """Test that an index file that would be saved with the snapshots is rejected."""
+        with patch.object(VersionManager, "_upload_dir_to_gcs") as mock_upload:
+            with pytest.raises(ValueError, match="outside local_dir_path"):
+                manager = ConcreteVersionManager(
+                    local_dir_path=temp_prompts_dir,
+                    gcs_bucket_name="test-bucket",
+                    gcs_dir_path="test-prompts",
+                    prompt_index_path=str(Path(temp_prompts_dir) / ".index.pkl"),
+                )
+                manager.save_snapshot("major")
+
+        mock_upload.assert_not_called()
+
+        # Paths that only resolve into the prompts directory are rejected too
+        with pytest.raises(ValueError, match="outside local_dir_path"):
+            ConcreteVersionManager(
+                local_dir_path=temp_prompts_dir,
+                prompt_index_path=str(
+                    Path(temp_prompts_dir) / "generic" / ".." / "cache" / "index.pkl"
+                ),
+            )
+
+    def test_load_local_prompt_empty_file(self, version_manager_local):
+        """Test loading an empty local prompt file."""
+        file_path = version_manager_local.local_dir_path / "generic" / "empty.yaml"
+        file_path.write_text("")
+
+        assert version_manager_local.load_prompt(["generic", "empty"]) is None
+
+    def test_load_local_prompt_uses_libyaml_loader(self, version_manager_local):
+        """Test that prompts are parsed with the LibYAML loader when available."""
+        assert YAML_LOADER is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            version_manager_local.load_prompt(["generic", "metric_1"])
+
+        assert mock_load.call_args.kwargs["Loader"] is YAML_LOADER
+
+    def test_load_prompt_as_str_field_not_copied(self, version_manager_local):
+        """Test that extracting a field reads the cached prompt without copying it."""
+        version_manager_local.load_prompt(["generic", "metric_1"])
+
+        with patch("copy.deepcopy") as mock_deepcopy:
+            result = version_manager_local.load_prompt_as_str(
+                ["generic", "metric_1"], field="metric_1"
+            )
+
+        assert "This is a generic prompt." in result
+        mock_deepcopy.assert_not_called()
+
     def test_load_local_prompt_not_found(self, version_manager_local):
         """Test loading non-existent local prompt."""
         with pytest.raises(FileNotFoundError, match="Prompt file not found"):
             version_manager_local.load_prompt(["nonexistent", "prompt"])
 
+    def test_load_local_prompt_not_found_under_file(self, version_manager_local):
+        """Test loading a prompt whose path goes through an existing file."""
+        (version_manager_local.local_dir_path / "generic" / "a.yaml").write_text("")
+
+        with pytest.raises(FileNotFoundError, match="Prompt file not found"):
+            version_manager_local.load_prompt(["generic", "a.yaml", "b"])
+
     def test_load_prompt_as_str_full(self, version_manager_local):
         """Test loading prompt as full YAML string."""
         result = version_manager_local.load_prompt_as_str(["generic", "metric_1"])
@@ -102,15 +310,50 @@ class TestLocalPromptOperations:
         assert "metric_1:" in result
         assert "description: This is a generic prompt." in result
 
+    def test_load_prompt_as_str_full_formatted_once(self, version_manager_local):
+        """Test that an unchanged prompt is only formatted once as a full string."""
+        with patch("yaml.dump", wraps=yaml.dump) as mock_dump:
+            first = version_manager_local.load_prompt_as_str(["generic", "metric_1"])
+            second = version_manager_local.load_prompt_as_str(["generic", "metric_1"])
+
+        assert second == first
+        assert mock_dump.call_count == 1
+
+        file_path = version_manager_local.local_dir_path / "generic" / "metric_1.yaml"
+        file_path.write_text("metric_1:\n  description: Edited prompt\n")
+
+        edited = version_manager_local.load_prompt_as_str(["generic", "metric_1"])
+
+        assert "description: Edited prompt" in edited
+
     def test_load_prompt_as_str_specific_field(self, version_manager_local):
         """Test loading specific field from prompt."""
         result = version_manager_local.load_prompt_as_str(
             ["generic", "metric_1"], field="metric_1"
         )
 
-        # Should return the metric_1 section as a string representation
-        assert "'description': 'This is a generic prompt.'" in result
-        assert "'synonyms'" in result
+        # Should return the metric_1 section formatted as YAML
+        assert "description: This is a generic prompt." in result
+        assert "synonyms:" in result
+        assert yaml.safe_load(result)["description"] == "This is a generic prompt."
+
+    def test_load_prompt_as_str_scalar_field(self, version_manager_local):
+        """Test that a scalar field is returned as its plain string value."""
+        file_path = version_manager_local.local_dir_path / "generic" / "flat.yaml"
+        file_path.write_text("instructions: Extract the metric\nretries: 3\n")
+
+        assert (
+            version_manager_local.load_prompt_as_str(
+                ["generic", "flat"], field="instructions"
+            )
+            == "Extract the metric"
+        )
+        assert (
+            version_manager_local.load_prompt_as_str(
+                ["generic", "flat"], field="retries"
+            )
+            == "3"
+        )
 
     def test_load_prompt_as_str_field_not_found(self, version_manager_local):
         """Test loading non-existent field from prompt."""
@@ -123,23 +366,92 @@ class TestLocalPromptOperations:
 class TestGCSPromptOperations:
     """Test GCS prompt operations with mocking."""
 
-    def test_load_gcs_prompt_success(self, version_manager_gcs, sample_yaml_content):
+    def test_load_gcs_prompt_success(self, version_manager_gcs, sample_yaml_bytes):
         """Test successful loading of GCS prompt."""
         # Setup mock
-        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.exists.return_value = True
-        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.download_as_text.return_value = yaml.dump(
-            sample_yaml_content
-        )
+        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.download_as_bytes.return_value = sample_yaml_bytes
 
         result = version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
 
         assert "test_metric" in result
         assert result["test_metric"]["description"] == "Sample test prompt"
 
+    def test_load_gcs_prompt_cached(self, version_manager_gcs, sample_yaml_bytes):
+        """Test that a prompt loaded from a GCS version is only downloaded once."""
+        blob = version_manager_gcs._gcs_client.bucket.return_value.blob.return_value
+        blob.download_as_bytes.return_value = sample_yaml_bytes
+
+        first = version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
+        first["test_metric"]["description"] = "Modified by the caller"
+        second = version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
+
+        assert second["test_metric"]["description"] == "Sample test prompt"
+        assert blob.download_as_bytes.call_count == 1
+        blob.exists.assert_not_called()
+
+    def test_clear_cache(self, version_manager_gcs, sample_yaml_bytes):
+        """Test that clearing the cache downloads the GCS prompt again."""
+        blob = version_manager_gcs._gcs_client.bucket.return_value.blob.return_value
+        blob.download_as_bytes.return_value = sample_yaml_bytes
+
+        version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
+        version_manager_gcs.clear_cache()
+        version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
+
+        assert blob.download_as_bytes.call_count == 2
+
+    def test_load_gcs_prompt_cache_disabled(
+        self, version_manager_gcs, sample_yaml_bytes
+    ):
+        """Test that GCS prompts are downloaded every time when the cache size is 0."""
+        version_manager_gcs.prompt_cache_size = 0
+        blob = version_manager_gcs._gcs_client.bucket.return_value.blob.return_value
+        blob.download_as_bytes.return_value = sample_yaml_bytes
+
+        version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
+        version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
+
+        assert blob.download_as_bytes.call_count == 2
+
+    def test_load_prompts_from_gcs(self, version_manager_gcs):
+        """Test loading several GCS prompts, returned in the order of the keys."""
+
+        def make_blob(name):
+            blob = Mock()
+            blob.download_as_bytes.return_value = yaml.dump({"name": name}).encode(
+                "utf-8"
+            )
+            return blob
+
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.blob.side_effect = make_blob
+
+        keys_list = [["generic", f"metric_{i}"] for i in range(5)]
+        results = version_manager_gcs.load_prompts(keys_list, version="1.0.0")
+
+        assert results == [
+            {"name": f"test-prompts/Version 1.0.0/generic/metric_{i}.yaml"}
+            for i in range(5)
+        ]
+
+    def test_load_prompts_local(self, version_manager_local):
+        """Test loading several local prompts."""
+        results = version_manager_local.load_prompts(
+            [["generic", "metric_1"], ["customized", "brand_1", "metric_1"]]
+        )
+
+        assert results[0]["metric_1"]["description"] == "This is a generic prompt."
+        assert (
+            results[1]["metric_1"]["description"]
+            == "This is a brand 1 specific prompt."
+        )
+
     def test_load_gcs_prompt_not_found(self, version_manager_gcs):
         """Test loading non-existent GCS prompt."""
-        # Setup mock to return False for exists()
-        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.exists.return_value = False
+        # Setup mock to raise NotFound for the download
+        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.download_as_bytes.side_effect = NotFound(
+            "No such object"
+        )
 
         with pytest.raises(FileNotFoundError, match="Prompt file not found in GCS"):
             version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
@@ -149,26 +461,15 @@ class TestGCSPromptOperations:
         with pytest.raises(ValueError, match="GCS configuration required"):
             version_manager_local.load_prompt(["test", "prompt"], version="1.0.0")
 
-    def test_load_prompt_latest_version(self, version_manager_gcs, sample_yaml_content):
+    def test_load_prompt_latest_version(self, version_manager_gcs, sample_yaml_bytes):
         """Test loading latest version from GCS."""
         # Mock list_versions to return sorted versions
-        mock_blobs = [
-            Mock(name="test-prompts/Version 1.0.0/test.yaml"),
-            Mock(name="test-prompts/Version 1.1.0/test.yaml"),
-            Mock(name="test-prompts/Version 2.0.0/test.yaml"),
-        ]
-        for i, blob in enumerate(mock_blobs):
-            blob.name = (
-                f"test-prompts/Version {['1.0.0', '1.1.0', '2.0.0'][i]}/test.yaml"
-            )
+        mock_blobs = mock_version_blobs(["1.0.0", "1.1.0", "2.0.0"])
 
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
         )
-        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.exists.return_value = True
-        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.download_as_text.return_value = yaml.dump(
-            sample_yaml_content
-        )
+        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.download_as_bytes.return_value = sample_yaml_bytes
 
         result = version_manager_gcs.load_prompt(["test", "prompt"], version="latest")
 
@@ -191,14 +492,7 @@ class TestVersionManagement:
 
     def test_list_versions_success(self, version_manager_gcs):
         """Test successful listing of versions."""
-        mock_blobs = [
-            Mock(name="test-prompts/Version 1.0.0/test.yaml"),
-            Mock(name="test-prompts/Version 1.1.0/test.yaml"),
-            Mock(name="test-prompts/Version 2.0.0/test.yaml"),
-            Mock(name="test-prompts/Version 0.9.0/test.yaml"),
-        ]
-        for i, blob in enumerate(mock_blobs):
-            blob.name = f"test-prompts/Version {['1.0.0', '1.1.0', '2.0.0', '0.9.0'][i]}/test.yaml"
+        mock_blobs = mock_version_blobs(["1.0.0", "1.1.0", "2.0.0", "0.9.0"])
 
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
@@ -209,6 +503,51 @@ class TestVersionManagement:
         # Should be sorted in descending order
         assert versions == ["2.0.0", "1.1.0", "1.0.0", "0.9.0"]
 
+    def test_list_versions_lists_folders_only(self, version_manager_gcs):
+        """Test that versions are listed from folder prefixes, not every blob."""
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+
+        version_manager_gcs.list_versions()
+
+        bucket.list_blobs.assert_called_once_with(
+            prefix="test-prompts/Version ",
+            delimiter="/",
+            fields="prefixes,nextPageToken",
+        )
+
+    def test_list_versions_cached(self, version_manager_gcs):
+        """Test that list_versions reuses a recent listing."""
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.list_blobs.return_value = mock_version_blobs(["1.0.0"])
+
+        assert version_manager_gcs.list_versions() == ["1.0.0"]
+        assert version_manager_gcs.list_versions() == ["1.0.0"]
+        assert bucket.list_blobs.call_count == 1
+
+    def test_list_versions_cache_disabled(self, version_manager_gcs):
+        """Test that list_versions always lists when the cache TTL is 0."""
+        version_manager_gcs.versions_cache_ttl = 0
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.list_blobs.return_value = []
+
+        version_manager_gcs.list_versions()
+        version_manager_gcs.list_versions()
+
+        assert bucket.list_blobs.call_count == 2
+
+    def test_list_versions_cache_cleared_on_save(self, version_manager_gcs):
+        """Test that saving a snapshot invalidates the cached version listing."""
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.list_blobs.return_value = []
+        assert version_manager_gcs.list_versions() == []
+
+        with patch.object(version_manager_gcs, "_upload_dir_to_gcs"):
+            version_manager_gcs.save_snapshot("major")
+
+        bucket.list_blobs.return_value = mock_version_blobs(["1.0.0"])
+
+        assert version_manager_gcs.list_versions() == ["1.0.0"]
+
     def test_list_versions_no_gcs_config(self, version_manager_local):
         """Test listing versions without GCS configuration."""
         with pytest.raises(ValueError, match="GCS configuration required"):
@@ -216,15 +555,7 @@ class TestVersionManagement:
 
     def test_list_versions_with_invalid_versions(self, version_manager_gcs):
         """Test listing versions with some invalid version strings."""
-        mock_blobs = [
-            Mock(name="test-prompts/Version 1.0.0/test.yaml"),
-            Mock(name="test-prompts/Version invalid/test.yaml"),
-            Mock(name="test-prompts/Version 2.0.0/test.yaml"),
-        ]
-        for i, blob in enumerate(mock_blobs):
-            blob.name = (
-                f"test-prompts/Version {['1.0.0', 'invalid', '2.0.0'][i]}/test.yaml"
-            )
+        mock_blobs = mock_version_blobs(["1.0.0", "invalid", "2.0.0"])
 
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
@@ -235,6 +566,20 @@ class TestVersionManagement:
         # Should only include valid versions
         assert versions == ["2.0.0", "1.0.0"]
 
+    def test_list_versions_sorted_numerically(self, version_manager_gcs):
+        """Test that versions sort by number and only major.minor.patch is accepted."""
+        mock_blobs = mock_version_blobs(
+            ["2.0.0", "10.0.0", "1.10.0", "1.9.0", "1.0", "1.0.0rc1"]
+        )
+
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
+            mock_blobs
+        )
+
+        versions = version_manager_gcs.list_versions()
+
+        assert versions == ["10.0.0", "2.0.0", "1.10.0", "1.9.0"]
+
     def test_get_next_version_no_existing(self, version_manager_gcs):
         """Test getting next version when no versions exist."""
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = []
@@ -246,10 +591,7 @@ class TestVersionManagement:
 
     def test_get_next_version_with_existing(self, version_manager_gcs):
         """Test getting next version with existing versions."""
-        mock_blobs = [
-            Mock(name="test-prompts/Version 1.2.3/test.yaml"),
-        ]
-        mock_blobs[0].name = "test-prompts/Version 1.2.3/test.yaml"
+        mock_blobs = mock_version_blobs(["1.2.3"])
 
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
@@ -259,6 +601,16 @@ class TestVersionManagement:
         assert version_manager_gcs._get_next_version("minor") == "1.3.0"
         assert version_manager_gcs._get_next_version("patch") == "1.2.4"
 
+    def test_get_next_version_compares_numerically(self, version_manager_gcs):
+        """Test that the latest version is found numerically, skipping invalid ones."""
+        mock_blobs = mock_version_blobs(["1.9.0", "1.10.0", "2.0", "invalid"])
+
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
+            mock_blobs
+        )
+
+        assert version_manager_gcs._get_next_version("minor") == "1.11.0"
+
 
 class TestSnapshotOperations:
     """Test snapshot save and load operations."""
@@ -275,37 +627,168 @@ class TestSnapshotOperations:
             assert version == "1.0.0"
             mock_upload.assert_called_once_with("1.0.0")
 
+    def test_save_snapshot_lists_versions_once(self, version_manager_gcs):
+        """Test that saving a snapshot lists the version folders only once."""
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.list_blobs.return_value = mock_version_blobs(["1.0.0"])
+
+        version = version_manager_gcs.save_snapshot("minor")
+
+        assert version == "1.1.0"
+        folder_listings = [
+            call
+            for call in bucket.list_blobs.call_args_list
+            if call.kwargs.get("delimiter") == "/"
+        ]
+        assert len(folder_listings) == 1
+
     def test_save_snapshot_no_gcs_config(self, version_manager_local):
         """Test saving snapshot without GCS configuration."""
         with pytest.raises(ValueError, match="GCS configuration required"):
             version_manager_local.save_snapshot()
 
-    def test_load_snapshot_success(self, version_manager_gcs):
+    def test_save_snapshot_bundled(self, version_manager_gcs):
+        """Test saving a snapshot as a single archive blob."""
+        version_manager_gcs.bundle_snapshots = True
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        archived_names = []
+
+        def read_archive(filename):
+            with tarfile.open(filename, "r:gz") as tar:
+                archived_names.extend(tar.getnames())
+
+        bucket.blob.return_value.upload_from_filename.side_effect = read_archive
+
+        result = version_manager_gcs.save_snapshot("major")
+
+        assert result == "1.0.0"
+        bucket.blob.assert_called_once_with(
+            "test-prompts/Version 1.0.0/snapshot.tar.gz"
+        )
+        assert sorted(archived_names) == [
+            "customized/brand_1/metric_1.yaml",
+            "customized/brand_2/metric_1.yaml",
+            "generic/metric_1.yaml",
+        ]
+
+    def test_download_gcs_to_dir_bundled(self, version_manager_gcs, tmp_path):
+        """Test downloading a bundled snapshot extracts its archive."""
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+            content = b"metric_1:\n  description: Bundled prompt\n"
+            info = tarfile.TarInfo("generic/metric_1.yaml")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+        bundle_blob = Mock()
+        bundle_blob.name = "test-prompts/Version 1.0.0/snapshot.tar.gz"
+        bundle_blob.size = len(archive.getvalue())
+        bundle_blob.download_to_filename.side_effect = lambda filename: Path(
+            filename
+        ).write_bytes(archive.getvalue())
+
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = [
+            bundle_blob
+        ]
+
+        target_dir = tmp_path
+
+        version_manager_gcs._download_gcs_to_dir("1.0.0", target_dir)
+
+        assert (target_dir / "generic" / "metric_1.yaml").read_bytes() == content
+        assert not (target_dir / "snapshot.tar.gz").exists()
+
+    def test_load_gcs_prompt_bundled(
+        self, version_manager_gcs, sample_yaml_content, sample_yaml_bytes
+    ):
+        """Test loading prompts from the archive of a bundled snapshot."""
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+            for name in ["test/prompt.yaml", "test/other.yaml", "generic/third.yaml"]:
+                info = tarfile.TarInfo(name)
+                info.size = len(sample_yaml_bytes)
+                tar.addfile(info, io.BytesIO(sample_yaml_bytes))
+
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        prompt_blob = Mock()
+        prompt_blob.download_as_bytes.side_effect = NotFound("No such object")
+        bundle_blob = Mock()
+        bundle_blob.download_as_bytes.return_value = archive.getvalue()
+        bucket.blob.side_effect = lambda name: (
+            bundle_blob if name.endswith("snapshot.tar.gz") else prompt_blob
+        )
+
+        for keys in [["test", "prompt"], ["test", "other"], ["generic", "third"]]:
+            result = version_manager_gcs.load_prompt(keys, version="1.0.0")
+            assert result == sample_yaml_content
+        with pytest.raises(FileNotFoundError):
+            version_manager_gcs.load_prompt(["test", "missing"], version="1.0.0")
+
+        # The archive is downloaded once for all of its prompts, and once the version
+        # is known to be bundled, the per-file blobs are no longer tried
+        assert bundle_blob.download_as_bytes.call_count == 1
+        assert prompt_blob.download_as_bytes.call_count == 1
+
+    def test_load_gcs_prompt_bundled_cache_disabled(
+        self, version_manager_gcs, sample_yaml_bytes
+    ):
+        """Test that bundled prompts still load when the prompt cache is disabled."""
+        version_manager_gcs.prompt_cache_size = 0
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+            info = tarfile.TarInfo("test/prompt.yaml")
+            info.size = len(sample_yaml_bytes)
+            tar.addfile(info, io.BytesIO(sample_yaml_bytes))
+
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        prompt_blob = Mock()
+        prompt_blob.download_as_bytes.side_effect = NotFound("No such object")
+        bundle_blob = Mock()
+        bundle_blob.download_as_bytes.return_value = archive.getvalue()
+        bucket.blob.side_effect = lambda name: (
+            bundle_blob if name.endswith("snapshot.tar.gz") else prompt_blob
+        )
+
+        version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
+        result = version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
+
+        assert result["test_metric"]["description"] == "Sample test prompt"
+        assert prompt_blob.download_as_bytes.call_count == 1
+
+    def test_load_snapshot_success(self, version_manager_gcs, tmp_path):
         """Test successful snapshot loading."""
         # Mock version existence check
-        mock_blobs = [Mock(name="test-prompts/Version 1.0.0/test.yaml")]
+        mock_blobs = mock_version_blobs(["1.0.0"])
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
         )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_dir = Path(temp_dir) / "downloaded_prompts"
+        target_dir = tmp_path / "downloaded_prompts"
 
-            # Mock the download process
-            with patch.object(
-                version_manager_gcs, "_download_gcs_to_dir"
-            ) as mock_download:
-                result_path = version_manager_gcs.load_snapshot(
-                    "1.0.0", str(target_dir)
-                )
+        # Mock the download process
+        with patch.object(version_manager_gcs, "_download_gcs_to_dir") as mock_download:
+            result_path = version_manager_gcs.load_snapshot("1.0.0", str(target_dir))
 
-                assert result_path == str(target_dir)
-                mock_download.assert_called_once_with("1.0.0", target_dir)
+            assert result_path == str(target_dir)
+            mock_download.assert_called_once_with("1.0.0", target_dir, blobs=mock_blobs)
+
+    def test_load_snapshot_lists_version_once(self, version_manager_gcs, tmp_path):
+        """Test that the version folder is listed once to validate and download it."""
+        blob = Mock()
+        blob.name = "test-prompts/Version 1.0.0/test.yaml"
+        blob.size = 16
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.list_blobs.return_value = [blob]
+
+        version_manager_gcs.load_snapshot("1.0.0", str(tmp_path / "target"))
+
+        bucket.list_blobs.assert_called_once()
+        blob.download_to_filename.assert_called_once()
 
     def test_load_snapshot_replace_local(self, version_manager_gcs):
         """Test loading snapshot with replace=True."""
         # Mock version existence check
-        mock_blobs = [Mock(name="test-prompts/Version 1.0.0/test.yaml")]
+        mock_blobs = mock_version_blobs(["1.0.0"])
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
         )
@@ -318,45 +801,68 @@ class TestSnapshotOperations:
             result_path = version_manager_gcs.load_snapshot("1.0.0", replace=True)
 
             assert result_path == str(version_manager_gcs.local_dir_path)
-            mock_rmtree.assert_called_once_with(version_manager_gcs.local_dir_path)
-            mock_download.assert_called_once()
+            # The local directory is synced in place rather than deleted up front
+            mock_rmtree.assert_not_called()
+            mock_download.assert_called_once_with(
+                "1.0.0", version_manager_gcs.local_dir_path, sync=True, blobs=mock_blobs
+            )
 
-    def test_load_snapshot_latest_version(self, version_manager_gcs):
-        """Test loading latest snapshot."""
-        # Mock version listing
-        mock_blobs_list = [
-            Mock(name="test-prompts/Version 1.0.0/test.yaml"),
-            Mock(name="test-prompts/Version 2.0.0/test.yaml"),
+    def test_load_snapshot_replace_skips_unchanged_files(self, version_manager_gcs):
+        """Test that replacing local files only downloads changed and missing files."""
+        local_dir = version_manager_gcs.local_dir_path
+        unchanged_path = local_dir / "generic" / "metric_1.yaml"
+        changed_path = local_dir / "customized" / "brand_1" / "metric_1.yaml"
+        stale_path = local_dir / "customized" / "brand_2" / "metric_1.yaml"
+
+        def make_blob(relative_path, content):
+            blob = Mock()
+            blob.name = f"test-prompts/Version 1.0.0/{relative_path}"
+            blob.size = len(content)
+            blob.crc32c = base64.b64encode(
+                google_crc32c.Checksum(content).digest()
+            ).decode("utf-8")
+            blob.download_to_filename.side_effect = lambda filename: Path(
+                filename
+            ).write_bytes(content)
+            return blob
+
+        unchanged_blob = make_blob("generic/metric_1.yaml", unchanged_path.read_bytes())
+        changed_blob = make_blob("customized/brand_1/metric_1.yaml", b"changed: true\n")
+        new_blob = make_blob("customized/brand_3/metric_1.yaml", b"new: true\n")
+
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = [
+            unchanged_blob,
+            changed_blob,
+            new_blob,
         ]
-        mock_blobs_check = [Mock(name="test-prompts/Version 2.0.0/test.yaml")]
 
-        # Configure mock blobs with proper name attributes
-        for i, version_str in enumerate(["1.0.0", "2.0.0"]):
-            mock_blobs_list[i].name = f"test-prompts/Version {version_str}/test.yaml"
-        mock_blobs_check[0].name = "test-prompts/Version 2.0.0/test.yaml"
+        version_manager_gcs.load_snapshot("1.0.0", replace=True)
+
+        assert not unchanged_blob.download_to_filename.called
+        changed_blob.download_to_filename.assert_called_once_with(str(changed_path))
+        assert changed_path.read_bytes() == b"changed: true\n"
+        assert (local_dir / "customized" / "brand_3" / "metric_1.yaml").exists()
+        # Files and directories that are not part of the version are removed
+        assert not stale_path.exists()
+        assert not stale_path.parent.exists()
 
-        # Mock list_blobs to return different results for listing vs checking
-        def mock_list_blobs(prefix=None, **kwargs):
-            if "max_results" in kwargs:
-                return mock_blobs_check  # For existence check
-            return mock_blobs_list  # For version listing
+    def test_load_snapshot_latest_version(self, version_manager_gcs, tmp_path):
+        """Test loading latest snapshot."""
+        # Mock the blobs of two versions, which both the version listing and the
+        # existence check are derived from
+        mock_blobs = mock_version_blobs(["1.0.0", "2.0.0"])
 
-        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.side_effect = (
-            mock_list_blobs
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
+            mock_blobs
         )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_dir = Path(temp_dir) / "downloaded_prompts"
+        target_dir = tmp_path / "downloaded_prompts"
 
-            with patch.object(
-                version_manager_gcs, "_download_gcs_to_dir"
-            ) as mock_download:
-                result_path = version_manager_gcs.load_snapshot(
-                    "latest", str(target_dir)
-                )
+        with patch.object(version_manager_gcs, "_download_gcs_to_dir") as mock_download:
+            result_path = version_manager_gcs.load_snapshot("latest", str(target_dir))
 
-                assert result_path == str(target_dir)
-                mock_download.assert_called_once_with("2.0.0", target_dir)
+            assert result_path == str(target_dir)
+            mock_download.assert_called_once_with("2.0.0", target_dir, blobs=mock_blobs)
 
     def test_load_snapshot_version_not_found(self, version_manager_gcs):
         """Test loading non-existent snapshot version."""
@@ -377,21 +883,18 @@ class TestSnapshotOperations:
         ):
             version_manager_gcs.load_snapshot("1.0.0", replace=False)
 
-    def test_load_snapshot_target_exists(self, version_manager_gcs):
+    def test_load_snapshot_target_exists(self, version_manager_gcs, tmp_path):
         """Test loading snapshot when target directory already exists."""
-        mock_blobs = [Mock(name="test-prompts/Version 1.0.0/test.yaml")]
+        mock_blobs = mock_version_blobs(["1.0.0"])
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
         )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            existing_dir = Path(temp_dir) / "existing"
-            existing_dir.mkdir()
+        existing_dir = tmp_path / "existing"
+        existing_dir.mkdir()
 
-            with pytest.raises(
-                FileExistsError, match="Target directory already exists"
-            ):
-                version_manager_gcs.load_snapshot("1.0.0", str(existing_dir))
+        with pytest.raises(FileExistsError, match="Target directory already exists"):
+            version_manager_gcs.load_snapshot("1.0.0", str(existing_dir))
 
 
 class TestIgnoreFunctionality:
@@ -404,55 +907,51 @@ class TestIgnoreFunctionality:
 
         assert not manager._should_ignore_file(test_file)
 
-    def test_should_ignore_file_with_patterns(self):
+    def test_should_ignore_file_with_patterns(self, tmp_path):
         """Test _should_ignore_file with various patterns."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            prompts_dir = temp_path / "prompts"
-            prompts_dir.mkdir()
+        prompts_dir = tmp_path / "prompts"
+        prompts_dir.mkdir()
 
-            manager = ConcreteVersionManager(
-                local_dir_path=str(prompts_dir),
-                ignore_files=["*.log", "*.tmp", "cache/*", "temp_*"],
-            )
+        manager = ConcreteVersionManager(
+            local_dir_path=str(prompts_dir),
+            ignore_files=["*.log", "*.tmp", "cache/*", "temp_*"],
+        )
 
-            # Test files that should be ignored
-            log_file = prompts_dir / "debug.log"
-            tmp_file = prompts_dir / "temporary.tmp"
-            cache_file = prompts_dir / "cache" / "data.yaml"
-            temp_file = prompts_dir / "temp_backup.yaml"
+        # Test files that should be ignored
+        log_file = prompts_dir / "debug.log"
+        tmp_file = prompts_dir / "temporary.tmp"
+        cache_file = prompts_dir / "cache" / "data.yaml"
+        temp_file = prompts_dir / "temp_backup.yaml"
 
-            assert manager._should_ignore_file(log_file)
-            assert manager._should_ignore_file(tmp_file)
-            assert manager._should_ignore_file(cache_file)
-            assert manager._should_ignore_file(temp_file)
+        assert manager._should_ignore_file(log_file)
+        assert manager._should_ignore_file(tmp_file)
+        assert manager._should_ignore_file(cache_file)
+        assert manager._should_ignore_file(temp_file)
 
-            # Test files that should not be ignored
-            yaml_file = prompts_dir / "prompt.yaml"
-            json_file = prompts_dir / "config.json"
+        # Test files that should not be ignored
+        yaml_file = prompts_dir / "prompt.yaml"
+        json_file = prompts_dir / "config.json"
 
-            assert not manager._should_ignore_file(yaml_file)
-            assert not manager._should_ignore_file(json_file)
+        assert not manager._should_ignore_file(yaml_file)
+        assert not manager._should_ignore_file(json_file)
 
-    def test_should_ignore_file_subdirectories(self):
+    def test_should_ignore_file_subdirectories(self, tmp_path):
         """Test _should_ignore_file with files in subdirectories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            prompts_dir = temp_path / "prompts"
-            prompts_dir.mkdir()
+        prompts_dir = tmp_path / "prompts"
+        prompts_dir.mkdir()
 
-            manager = ConcreteVersionManager(
-                local_dir_path=str(prompts_dir), ignore_files=["*.log", "subdir/*.tmp"]
-            )
+        manager = ConcreteVersionManager(
+            local_dir_path=str(prompts_dir), ignore_files=["*.log", "subdir/*.tmp"]
+        )
 
-            # Test files in subdirectories
-            subdir_log = prompts_dir / "custom" / "brand1" / "debug.log"
-            subdir_tmp = prompts_dir / "subdir" / "temp.tmp"
-            subdir_yaml = prompts_dir / "subdir" / "prompt.yaml"
+        # Test files in subdirectories
+        subdir_log = prompts_dir / "custom" / "brand1" / "debug.log"
+        subdir_tmp = prompts_dir / "subdir" / "temp.tmp"
+        subdir_yaml = prompts_dir / "subdir" / "prompt.yaml"
 
-            assert manager._should_ignore_file(subdir_log)  # *.log matches anywhere
-            assert manager._should_ignore_file(subdir_tmp)  # subdir/*.tmp matches
-            assert not manager._should_ignore_file(subdir_yaml)  # Not matching pattern
+        assert manager._should_ignore_file(subdir_log)  # *.log matches anywhere
+        assert manager._should_ignore_file(subdir_tmp)  # subdir/*.tmp matches
+        assert not manager._should_ignore_file(subdir_yaml)  # Not matching pattern
 
     def test_should_ignore_gcs_path_no_patterns(self):
         """Test _should_ignore_gcs_path with no ignore patterns."""
@@ -496,15 +995,20 @@ class TestErrorHandling:
     def test_yaml_parsing_error(self, version_manager_gcs):
         """Test handling of invalid YAML content."""
         # Mock invalid YAML content
-        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.exists.return_value = True
-        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.download_as_text.return_value = "invalid: yaml: content: ["
+        version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.download_as_bytes.return_value = b"invalid: yaml: content: ["
 
         with pytest.raises(yaml.YAMLError):
             version_manager_gcs.load_prompt(["test", "prompt"], version="1.0.0")
 
     def test_file_permission_error(self, version_manager_local):
         """Test handling of file permission errors."""
-        with patch("builtins.open", side_effect=PermissionError("Permission denied")):
+        # Only replace open as seen by the version manager module, rather than the
+        # builtin that pytest itself relies on
+        with patch(
+            "prompt2blob_vm.version_manager.open",
+            side_effect=PermissionError("Permission denied"),
+            create=True,
+        ):
             with pytest.raises(PermissionError):
                 version_manager_local.load_prompt(["generic", "metric_1"])
 
@@ -512,7 +1016,7 @@ class TestErrorHandling:
 class TestPrivateMethods:
     """Test private helper methods."""
 
-    def test_download_gcs_to_dir(self, version_manager_gcs):
+    def test_download_gcs_to_dir(self, version_manager_gcs, tmp_path):
         """Test downloading GCS content to local directory."""
         mock_blobs = [
             Mock(),
@@ -530,87 +1034,225 @@ class TestPrivateMethods:
         # Configure mock blobs
         for blob in mock_blobs:
             blob.download_to_filename = Mock()
+            blob.size = 1024
+
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
+            mock_blobs
+        )
+
+        target_dir = tmp_path
+
+        version_manager_gcs._download_gcs_to_dir("1.0.0", target_dir)
+
+        # Verify download_to_filename was called for non-directory blobs
+        assert mock_blobs[0].download_to_filename.called
+        assert mock_blobs[1].download_to_filename.called
+        assert not mock_blobs[2].download_to_filename.called  # Directory marker
+
+    def test_download_gcs_to_dir_target_paths(self, version_manager_gcs, tmp_path):
+        """Test that concurrent downloads write each blob to its own target path."""
+        mock_blobs = [Mock() for _ in range(20)]
+        for i, blob in enumerate(mock_blobs):
+            blob.name = f"test-prompts/Version 1.0.0/dir_{i % 3}/metric_{i}.yaml"
+            blob.size = 1024
+
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
+            mock_blobs
+        )
+
+        target_dir = tmp_path
+
+        version_manager_gcs._download_gcs_to_dir("1.0.0", target_dir)
+
+        for i, blob in enumerate(mock_blobs):
+            blob.download_to_filename.assert_called_once_with(
+                str(target_dir / f"dir_{i % 3}" / f"metric_{i}.yaml")
+            )
+            assert (target_dir / f"dir_{i % 3}").is_dir()
+
+    def test_download_gcs_to_dir_concurrent(self, version_manager_gcs, tmp_path):
+        """Test that blobs are downloaded concurrently rather than one by one."""
+        mock_blobs = [Mock() for _ in range(4)]
+        # Each download waits until all of them have started, which would time out
+        # if they were downloaded one after another
+        barrier = threading.Barrier(len(mock_blobs), timeout=5)
+        thread_ids = set()
+
+        def download_to_filename(filename):
+            thread_ids.add(threading.get_ident())
+            barrier.wait()
+
+        for i, blob in enumerate(mock_blobs):
+            blob.name = f"test-prompts/Version 1.0.0/generic/metric_{i}.yaml"
+            blob.size = 1024
+            blob.download_to_filename.side_effect = download_to_filename
 
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
         )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_dir = Path(temp_dir)
+        version_manager_gcs._download_gcs_to_dir("1.0.0", tmp_path)
+
+        assert len(thread_ids) == len(mock_blobs)
+
+    def test_download_gcs_to_dir_large_blob(self, version_manager_gcs, tmp_path):
+        """Test that large blobs are downloaded in concurrent chunks."""
+        small_blob = Mock()
+        small_blob.name = "test-prompts/Version 1.0.0/generic/metric_1.yaml"
+        small_blob.size = 1024
+        large_blob = Mock()
+        large_blob.name = "test-prompts/Version 1.0.0/bundle.tar"
+        large_blob.size = 128 * 1024 * 1024
+
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = [
+            small_blob,
+            large_blob,
+        ]
+
+        with patch(
+            "google.cloud.storage.transfer_manager.download_chunks_concurrently"
+        ) as mock_download_chunks:
+            target_dir = tmp_path
 
             version_manager_gcs._download_gcs_to_dir("1.0.0", target_dir)
 
-            # Verify download_to_filename was called for non-directory blobs
-            assert mock_blobs[0].download_to_filename.called
-            assert mock_blobs[1].download_to_filename.called
-            assert not mock_blobs[2].download_to_filename.called  # Directory marker
+            small_blob.download_to_filename.assert_called_once()
+            assert not large_blob.download_to_filename.called
+            mock_download_chunks.assert_called_once()
+            assert mock_download_chunks.call_args.args == (
+                large_blob,
+                str(target_dir / "bundle.tar"),
+            )
+
+    def test_download_gcs_to_dir_error(self, version_manager_gcs, tmp_path):
+        """Test that a failed download is raised from _download_gcs_to_dir."""
+        mock_blob = Mock()
+        mock_blob.name = "test-prompts/Version 1.0.0/generic/metric_1.yaml"
+        mock_blob.size = 1024
+        mock_blob.download_to_filename.side_effect = OSError("Download failed")
+
+        version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = [
+            mock_blob
+        ]
+
+        with pytest.raises(OSError, match="Download failed"):
+            version_manager_gcs._download_gcs_to_dir("1.0.0", tmp_path)
 
     def test_upload_dir_to_gcs(self, version_manager_gcs):
         """Test uploading local directory to GCS."""
-        mock_files = [
-            Mock(spec=Path),
-            Mock(spec=Path),  # Directory
+        # Add an empty directory, which has nothing to upload
+        (version_manager_gcs.local_dir_path / "empty").mkdir()
+
+        version_manager_gcs._upload_dir_to_gcs("1.0.0")
+
+        # Should only upload files, not directories
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        uploaded_paths = sorted(call.args[0] for call in bucket.blob.call_args_list)
+        assert uploaded_paths == [
+            "test-prompts/Version 1.0.0/customized/brand_1/metric_1.yaml",
+            "test-prompts/Version 1.0.0/customized/brand_2/metric_1.yaml",
+            "test-prompts/Version 1.0.0/generic/metric_1.yaml",
         ]
+        assert bucket.blob.return_value.upload_from_filename.call_count == 3
+
+    def test_upload_dir_to_gcs_missing_local_dir(self, version_manager_gcs, tmp_path):
+        """Test that a missing local directory has nothing to upload."""
+        version_manager_gcs.local_dir_path = tmp_path / "missing"
+
+        version_manager_gcs._upload_dir_to_gcs("1.0.0")
+
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.blob.assert_not_called()
+
+    def test_upload_dir_to_gcs_copies_unchanged_files(self, version_manager_gcs):
+        """Test that files unchanged since the previous version are copied in GCS."""
+        local_dir = version_manager_gcs.local_dir_path
+        unchanged_content = (local_dir / "generic" / "metric_1.yaml").read_bytes()
+
+        def make_blob(relative_path, content):
+            blob = Mock()
+            blob.name = f"test-prompts/Version 1.0.0/{relative_path}"
+            blob.size = len(content)
+            blob.crc32c = base64.b64encode(
+                google_crc32c.Checksum(content).digest()
+            ).decode("utf-8")
+            return blob
+
+        unchanged_blob = make_blob("generic/metric_1.yaml", unchanged_content)
+        changed_blob = make_blob("customized/brand_1/metric_1.yaml", b"old: true\n")
+
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.list_blobs.return_value = [unchanged_blob, changed_blob]
+
+        version_manager_gcs._upload_dir_to_gcs("2.0.0")
+
+        new_blob = bucket.blob.return_value
+        unchanged_blob.bucket.copy_blob.assert_called_once_with(
+            unchanged_blob,
+            new_blob.bucket,
+            new_blob.name,
+            source_generation=unchanged_blob.generation,
+            retry=DEFAULT_RETRY,
+        )
+        changed_blob.bucket.copy_blob.assert_not_called()
+        assert sorted(
+            call.args[0] for call in new_blob.upload_from_filename.call_args_list
+        ) == [
+            str(local_dir / "customized" / "brand_1" / "metric_1.yaml"),
+            str(local_dir / "customized" / "brand_2" / "metric_1.yaml"),
+        ]
+
+    def test_upload_dir_to_gcs_large_file(self, version_manager_gcs):
+        """Test that large files are uploaded in concurrent parts."""
+        large_file = version_manager_gcs.local_dir_path / "data" / "large.bin"
+        large_file.parent.mkdir()
+        with open(large_file, "wb") as f:
+            f.truncate(128 * 1024 * 1024)  # Sparse, so nothing is written
 
-        # Configure mock files
-        mock_files[0].is_file.return_value = True
-        mock_files[0].relative_to.return_value = Path("generic/metric_1.yaml")
-        mock_files[1].is_file.return_value = False  # Directory
+        blob = version_manager_gcs._gcs_client.bucket.return_value.blob.return_value
 
-        with patch("pathlib.Path.rglob", return_value=mock_files):
+        with patch(
+            "google.cloud.storage.transfer_manager.upload_chunks_concurrently"
+        ) as mock_upload_chunks:
             version_manager_gcs._upload_dir_to_gcs("1.0.0")
 
-            # Should only upload files, not directories
-            assert (
-                version_manager_gcs._gcs_client.bucket.return_value.blob.call_count == 1
-            )
-            assert (
-                version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.upload_from_filename.call_count
-                == 1
-            )
+        # The prompt files are uploaded in a single request each
+        assert blob.upload_from_filename.call_count == 3
+        mock_upload_chunks.assert_called_once()
+        assert mock_upload_chunks.call_args.args == (str(large_file), blob)
+
+    def test_upload_dir_to_gcs_error(self, version_manager_gcs):
+        """Test that an error while uploading a file is raised to the caller."""
+        blob = version_manager_gcs._gcs_client.bucket.return_value.blob.return_value
+        blob.upload_from_filename.side_effect = RuntimeError("Upload failed")
+
+        with pytest.raises(RuntimeError, match="Upload failed"):
+            version_manager_gcs._upload_dir_to_gcs("1.0.0")
 
     def test_upload_dir_to_gcs_with_ignore_files(self, version_manager_gcs):
         """Test uploading local directory to GCS with ignore patterns."""
         # Configure version manager with ignore patterns
-        version_manager_gcs.ignore_files = ["*.log", "*.tmp", "cache/*"]
-
-        mock_files = [
-            Mock(spec=Path),  # YAML file (should upload)
-            Mock(spec=Path),  # Log file (should ignore)
-            Mock(spec=Path),  # Tmp file (should ignore)
-            Mock(spec=Path),  # Cache file (should ignore)
-            Mock(spec=Path),  # Directory (should skip)
-        ]
+        version_manager_gcs.ignore_files = ["*.log", "*.tmp", "cache/*", "customized/*"]
 
-        # Configure mock files
-        mock_files[0].is_file.return_value = True
-        mock_files[0].relative_to.return_value = Path("generic/metric_1.yaml")
-        mock_files[1].is_file.return_value = True
-        mock_files[1].relative_to.return_value = Path("debug.log")
-        mock_files[2].is_file.return_value = True
-        mock_files[2].relative_to.return_value = Path("temp.tmp")
-        mock_files[3].is_file.return_value = True
-        mock_files[3].relative_to.return_value = Path("cache/data.yaml")
-        mock_files[4].is_file.return_value = False  # Directory
-
-        with patch("pathlib.Path.rglob", return_value=mock_files):
-            version_manager_gcs._upload_dir_to_gcs("1.0.0")
+        local_dir_path = version_manager_gcs.local_dir_path
+        (local_dir_path / "debug.log").write_text("log")
+        (local_dir_path / "temp.tmp").write_text("tmp")
+        (local_dir_path / "cache").mkdir()
+        (local_dir_path / "cache" / "data.yaml").write_text("cached: true")
 
-            # Should only upload the YAML file (1 file), ignoring log, tmp, and cache files
-            assert (
-                version_manager_gcs._gcs_client.bucket.return_value.blob.call_count == 1
-            )
-            assert (
-                version_manager_gcs._gcs_client.bucket.return_value.blob.return_value.upload_from_filename.call_count
-                == 1
-            )
+        version_manager_gcs._upload_dir_to_gcs("1.0.0")
 
-            # Verify the correct file was uploaded
-            version_manager_gcs._gcs_client.bucket.return_value.blob.assert_called_with(
-                "test-prompts/Version 1.0.0/generic/metric_1.yaml"
-            )
+        # Should only upload the generic YAML file, ignoring the log, tmp, cache and
+        # customized files
+        bucket = version_manager_gcs._gcs_client.bucket.return_value
+        bucket.blob.assert_called_once_with(
+            "test-prompts/Version 1.0.0/generic/metric_1.yaml"
+        )
+        bucket.blob.return_value.upload_from_filename.assert_called_once_with(
+            str(local_dir_path / "generic" / "metric_1.yaml")
+        )
 
-    def test_download_gcs_to_dir_with_ignore_files(self, version_manager_gcs):
+    def test_download_gcs_to_dir_with_ignore_files(self, version_manager_gcs, tmp_path):
         """Test downloading GCS content to local directory with ignore patterns."""
         # Configure version manager with ignore patterns
         version_manager_gcs.ignore_files = ["*.log", "*.tmp", "cache/*"]
@@ -633,19 +1275,19 @@ class TestPrivateMethods:
         # Configure mock blobs
         for blob in mock_blobs:
             blob.download_to_filename = Mock()
+            blob.size = 1024
 
         version_manager_gcs._gcs_client.bucket.return_value.list_blobs.return_value = (
             mock_blobs
         )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_dir = Path(temp_dir)
+        target_dir = tmp_path
 
-            version_manager_gcs._download_gcs_to_dir("1.0.0", target_dir)
+        version_manager_gcs._download_gcs_to_dir("1.0.0", target_dir)
 
-            # Verify only the YAML file was downloaded (ignored log, tmp, cache files)
-            assert mock_blobs[0].download_to_filename.called  # YAML file
-            assert not mock_blobs[1].download_to_filename.called  # Log file (ignored)
-            assert not mock_blobs[2].download_to_filename.called  # Tmp file (ignored)
-            assert not mock_blobs[3].download_to_filename.called  # Cache file (ignored)
-            assert not mock_blobs[4].download_to_filename.called  # Directory marker
+        # Verify only the YAML file was downloaded (ignored log, tmp, cache files)
+        assert mock_blobs[0].download_to_filename.called  # YAML file
+        assert not mock_blobs[1].download_to_filename.called  # Log file (ignored)
+        assert not mock_blobs[2].download_to_filename.called  # Tmp file (ignored)
+        assert not mock_blobs[3].download_to_filename.called  # Cache file (ignored)
+        assert not mock_blobs[4].download_to_filename.called  # Directory marker